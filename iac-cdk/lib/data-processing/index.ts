@@ -213,6 +213,24 @@ export class DataProcessing extends Construct {
                 resources: [`arn:aws:transcribe:${cdk.Aws.REGION}:${cdk.Aws.ACCOUNT_ID}:*`],
             }),
         );
+        // Documents run as child executions of the distributed map. The ARNs are built
+        // from the name to avoid a circular dependency on the state machine itself.
+        stateMachine.addToRolePolicy(
+            new iam.PolicyStatement({
+                actions: ["states:StartExecution"],
+                resources: [
+                    `arn:aws:states:${cdk.Aws.REGION}:${cdk.Aws.ACCOUNT_ID}:stateMachine:${prefix}-${name}`,
+                ],
+            }),
+        );
+        stateMachine.addToRolePolicy(
+            new iam.PolicyStatement({
+                actions: ["states:DescribeExecution", "states:StopExecution"],
+                resources: [
+                    `arn:aws:states:${cdk.Aws.REGION}:${cdk.Aws.ACCOUNT_ID}:execution:${prefix}-${name}/*`,
+                ],
+            }),
+        );
 
         funcStartPipeline.addToRolePolicy(
             new iam.PolicyStatement({
@@ -147,6 +147,22 @@ resource "aws_iam_role_policy" "state_machine" {
         ]
         Resource = ["arn:aws:transcribe:${local.region}:${local.account_id}:*"]
       },
+      {
+        # Documents run as child executions of the distributed map
+        Sid      = "DistributedMapChildExecutions"
+        Effect   = "Allow"
+        Action   = ["states:StartExecution"]
+        Resource = ["arn:aws:states:${local.region}:${local.account_id}:stateMachine:${var.prefix}-processData"]
+      },
+      {
+        Sid    = "DistributedMapExecutionControl"
+        Effect = "Allow"
+        Action = [
+          "states:DescribeExecution",
+          "states:StopExecution"
+        ]
+        Resource = ["arn:aws:states:${local.region}:${local.account_id}:execution:${var.prefix}-processData/*"]
+      },
       {
         Sid    = "CloudWatchLogs"
         Effect = "Allow"
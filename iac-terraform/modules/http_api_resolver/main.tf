@@ -143,7 +143,9 @@ data "aws_iam_policy_document" "http_resolver_dynamodb" {
       "dynamodb:UpdateItem",
       "dynamodb:DeleteItem",
       "dynamodb:Query",
-      "dynamodb:Scan"
+      "dynamodb:Scan",
+      "dynamodb:BatchWriteItem",
+      "dynamodb:BatchGetItem"
     ]
     resources = [
       var.sessions_table_arn,
@@ -5,6 +5,9 @@
 # ---------------------------------------------------------------------------- #
 from __future__ import annotations
 
+import re
+import string
+
 from pydantic import BaseModel, model_validator
 
 # Re-export KB types from shared for backwards compatibility
@@ -55,6 +58,14 @@ DEFAULT_NODE_TIMEOUT = 60.0  # 1 minute
 DEFAULT_REPETITIVE_HANDOFF_DETECTION_WINDOW = 5
 DEFAULT_REPETITIVE_HANDOFF_MIN_UNIQUE_AGENTS = 2
 
+# Characters not allowed in swarm agent names, with a translate table that
+# replaces them in ASCII names without going through the regex engine
+_INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z0-9-_/]")
+_ALLOWED_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "-_/")
+_SANITIZE_NAME_TABLE = str.maketrans(
+    {chr(i): "_" for i in range(128) if chr(i) not in _ALLOWED_NAME_CHARS}
+)
+
 # ============================================================================ #
 # Swarm-Specific Types
 # ============================================================================ #
@@ -105,10 +116,11 @@ class SwarmAgentDefinition(BaseModel):
 
         The name must match: [a-zA-Z0-9][a-zA-Z0-9-_/]*
         """
-        import re
-
         # Sanitize: replace spaces with underscores, remove invalid chars
-        sanitized = re.sub(r"[^a-zA-Z0-9-_/]", "_", self.name)
+        if self.name.isascii():
+            sanitized = self.name.translate(_SANITIZE_NAME_TABLE)
+        else:
+            sanitized = _INVALID_NAME_CHARS.sub("_", self.name)
         # Ensure it starts with alphanumeric
         if sanitized and not sanitized[0].isalnum():
             sanitized = "agent_" + sanitized
@@ -122,8 +134,7 @@ class SwarmAgentDefinition(BaseModel):
     @model_validator(mode="after")
     def validate_tool_parameters(self):
         """Validates that tool parameters match the defined tools."""
-        tool_names = {tool_name for tool_name in self.tools}
-        invalid_keys = set(self.toolParameters.keys()) - tool_names
+        invalid_keys = self.toolParameters.keys() - set(self.tools)
         if invalid_keys:
             raise ValueError(f"toolParameters keys {invalid_keys} not found in tools")
         return self
@@ -22,7 +22,12 @@ logger = Logger(service="graphQL-sessionsRoute")
 @tracer.capture_method
 @fetch_user_id(router)
 def get_sessions(user_id: str):
-    sessions = session_helper.list_sessions_by_user_id(user_id)
+    # Only the first message of History is needed, as fallback title
+    sessions = session_helper.list_sessions_by_user_id(
+        user_id,
+        projection="SessionId, #title, StartTime, RuntimeId, RuntimeVersion, #endpoint, History[0]",
+        attribute_names={"#title": "Title", "#endpoint": "Endpoint"},
+    )
 
     return [
         {
@@ -67,13 +72,16 @@ def get_session(user_id: str, id: str):
         if "structuredOutput" in data:
             history_item["structuredOutput"] = data["structuredOutput"]
         if "toolActions" in data:
-            # Convert Decimal to int for JSON serialization
-            tool_actions = data["toolActions"]
-            for action in tool_actions:
-                if "invocationNumber" in action and isinstance(
-                    action["invocationNumber"], Decimal
-                ):
-                    action["invocationNumber"] = int(action["invocationNumber"])
+            # Convert Decimal to int for JSON serialization, on copies since the
+            # session record may be shared with the session cache
+            tool_actions = [
+                (
+                    {**action, "invocationNumber": int(action["invocationNumber"])}
+                    if isinstance(action.get("invocationNumber"), Decimal)
+                    else action
+                )
+                for action in data["toolActions"]
+            ]
             history_item["toolActions"] = json.dumps(tool_actions)
         if "executionTimeMs" in data:
             history_item["executionTimeMs"] = data["executionTimeMs"]
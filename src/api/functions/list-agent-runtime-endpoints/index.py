@@ -8,6 +8,7 @@ from typing import Optional
 import boto3
 from aws_lambda_powertools import Logger, Tracer
 from aws_lambda_powertools.utilities.parser import BaseModel, event_parser
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 # ------------------- Lambda Powertools -------------------- #
@@ -16,7 +17,13 @@ logger = Logger(service="graphQL-listAgentRuntimeEndpoints")
 # ---------------------------------------------------------- #
 
 # --------------- Boto3 Clients/Resource ------------------- #
-BAC_CLIENT = boto3.client("bedrock-agentcore-control")
+CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    connect_timeout=3,
+    read_timeout=30,
+    retries={"max_attempts": 5, "mode": "adaptive"},
+)
+BAC_CLIENT = boto3.client("bedrock-agentcore-control", config=CLIENT_CONFIG)
 
 
 # ---------------------------------------------------------- #
@@ -35,6 +42,10 @@ class OutputModel(BaseModel):
 
 
 DEFAULT_ENDPOINT_ID = "DEFAULT"
+MAX_RESULTS = 20
+READY_ENDPOINT_NAMES = (
+    f"runtimeEndpoints[?status=='READY' && name!='{DEFAULT_ENDPOINT_ID}'].name"
+)
 
 
 @event_parser(model=InputModel)
@@ -49,41 +60,19 @@ def handler(event: InputModel, _) -> dict:
     Returns:
         dict: Response with status code and endpoint names
     """
-    endpoints = []
-    max_results = 20
     try:
-        response = BAC_CLIENT.list_agent_runtime_endpoints(
-            agentRuntimeId=event.agentRuntimeId, maxResults=max_results
+        paginator = BAC_CLIENT.get_paginator("list_agent_runtime_endpoints")
+        pages = paginator.paginate(
+            agentRuntimeId=event.agentRuntimeId,
+            PaginationConfig={"PageSize": MAX_RESULTS},
         )
-        endpoints.extend(
-            [
-                elem.get("name", "")
-                for elem in response.get("runtimeEndpoints", [])
-                if elem.get("status", "") == "READY"
-                and elem.get("name") != DEFAULT_ENDPOINT_ID
-            ]
-        )
-        while response.get("nextToken"):
-            response = BAC_CLIENT.list_agent_runtime_endpoints(
-                agentRuntimeId=event.agentRuntimeId,
-                maxResults=max_results,
-                nextToken=response.get("nextToken"),
-            )
-            endpoints.extend(
-                [
-                    elem.get("name", "")
-                    for elem in response.get("runtimeEndpoints", [])
-                    if elem.get("status", "") == "READY"
-                    and elem.get("name") != DEFAULT_ENDPOINT_ID
-                ]
-            )
+        endpoints = list(pages.search(READY_ENDPOINT_NAMES))
         output = OutputModel(status=200, body=Body(endpoints=endpoints))
     except ClientError as err:
         msg = "Failed to retrieve agent endpoints"
         logger.error(msg, extra={"rawErrorMessage": str(err)})
         output = OutputModel(status=400, body=Body(msg=msg))
 
-    logger.info(
-        "Lambda handler ready to return", extra={"lambdaResponse": output.model_dump()}
-    )
-    return output.model_dump(exclude_none=True)
+    response = output.model_dump(exclude_none=True)
+    logger.info("Lambda handler ready to return", extra={"lambdaResponse": response})
+    return response
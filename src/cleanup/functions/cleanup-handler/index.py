@@ -6,9 +6,12 @@
 # ----------------------------------------------------------------------- #
 
 
+import functools
+import logging
 import os
-from dataclasses import dataclass
-from typing import Any, Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, NamedTuple
 
 import boto3
 from aws_lambda_powertools import Logger, Tracer
@@ -18,6 +21,7 @@ from aws_lambda_powertools.utilities.data_classes import (
 )
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from botocore.client import BaseClient
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 # ------------------------- Lambda Powertools ------------------------ #
@@ -26,25 +30,28 @@ tracer = Tracer(service="aca-cleanUpResources")
 
 
 # ----------------------- Environment Variables ---------------------- #
+# Backwards compatibility with CDK deployments: the CDK_* variables are only
+# read when the IAC_* variable is unset or empty. Empty entries are dropped.
 # IaC-managed Knowledge Base IDs to preserve (CDK or Terraform created)
-IAC_KNOWLEDGE_BASE_IDS = (
-    set(os.environ.get("IAC_KNOWLEDGE_BASE_IDS", "").split(","))
-    if os.environ.get("IAC_KNOWLEDGE_BASE_IDS")
-    else set()
+IAC_KNOWLEDGE_BASE_IDS = frozenset(
+    filter(
+        None,
+        (
+            os.environ.get("IAC_KNOWLEDGE_BASE_IDS")
+            or os.environ.get("CDK_KNOWLEDGE_BASE_IDS", "")
+        ).split(","),
+    )
 )
-# Backwards compatibility with CDK deployments
-if not IAC_KNOWLEDGE_BASE_IDS and os.environ.get("CDK_KNOWLEDGE_BASE_IDS"):
-    IAC_KNOWLEDGE_BASE_IDS = set(os.environ["CDK_KNOWLEDGE_BASE_IDS"].split(","))
 
 # IaC-managed EventBridge rule names to preserve
-IAC_RULE_NAMES = (
-    set(os.environ.get("IAC_RULE_NAMES", "").split(","))
-    if os.environ.get("IAC_RULE_NAMES")
-    else set()
+IAC_RULE_NAMES = frozenset(
+    filter(
+        None,
+        (
+            os.environ.get("IAC_RULE_NAMES") or os.environ.get("CDK_RULE_NAMES", "")
+        ).split(","),
+    )
 )
-# Backwards compatibility with CDK deployments
-if not IAC_RULE_NAMES and os.environ.get("CDK_RULE_NAMES"):
-    IAC_RULE_NAMES = set(os.environ["CDK_RULE_NAMES"].split(","))
 
 KB_INVENTORY_TABLE_NAME = os.environ.get("KB_INVENTORY_TABLE")
 
@@ -58,33 +65,99 @@ IAC_OWNER_TAG = os.environ.get("IAC_OWNER_TAG", "CDK")
 # Feature flag to check if Knowledge Base is enabled
 KB_ENABLED = bool(KB_INVENTORY_TABLE_NAME)
 
+# Concurrent list_tags_for_resource calls issued while deciding what to delete
+TAG_LOOKUP_WORKERS = 16
+# Concurrent knowledge base inventory items processed during cleanup
+KB_CLEANUP_WORKERS = 8
+# Parallel scan segments used to read the knowledge base inventory table
+KB_SCAN_SEGMENTS = 4
+
 # -------------------------------------------------------------------- #
 
 # --------------------------- AWS CLIENTS ---------------------------- #
-DYNAMODB_RESOURCE = boto3.resource("dynamodb")
-BEDROCK_AGENT_CLIENT = boto3.client("bedrock-agent")
-EVENTS_CLIENT = boto3.client("events")
-BAC_CLIENT = boto3.client("bedrock-agentcore-control")
+# The pool covers the widest fan-out, the concurrent tag lookups
+CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=TAG_LOOKUP_WORKERS,
+    connect_timeout=3,
+    read_timeout=30,
+    retries={"max_attempts": 5, "mode": "adaptive"},
+)
+BAC_CLIENT = boto3.client("bedrock-agentcore-control", config=CLIENT_CONFIG)
+
+
+# The following are only needed for Knowledge Base cleanup, so they are created
+# on first use. Call them from the main thread before fanning out to workers.
+@functools.cache
+def _dynamodb_resource() -> Any:
+    return boto3.resource("dynamodb", config=CLIENT_CONFIG)
+
+
+@functools.cache
+def _bedrock_agent_client() -> BaseClient:
+    return boto3.client("bedrock-agent", config=CLIENT_CONFIG)
+
+
+@functools.cache
+def _events_client() -> BaseClient:
+    return boto3.client("events", config=CLIENT_CONFIG)
 
 
-# Only create table reference if KB is enabled
-KB_TABLE = DYNAMODB_RESOURCE.Table(KB_INVENTORY_TABLE_NAME) if KB_ENABLED else None  # type: ignore
 # -------------------------------------------------------------------- #
 
 
+class Runtime(NamedTuple):
+    arn: str
+    identifier: str
+
+
+class Memory(NamedTuple):
+    arn: str
+    identifier: str
+
+
+def _claim(processed: set, key: str, lock: threading.Lock) -> bool:
+    """Atomically mark ``key`` as processed, returning False if already claimed."""
+    with lock:
+        if key in processed:
+            return False
+        processed.add(key)
+        return True
+
+
+def _scan_segment(dynamodb: BaseClient, segment: int) -> list[Dict[str, Any]]:
+    """Read one segment of the knowledge base inventory table.
+
+    Only the attributes used by ``_process_kb_item`` are projected.
+    """
+    paginator = dynamodb.get_paginator("scan")
+    pages = paginator.paginate(
+        TableName=KB_INVENTORY_TABLE_NAME,
+        TotalSegments=KB_SCAN_SEGMENTS,
+        Segment=segment,
+        ProjectionExpression="KnowledgeBaseId,DataSourceId,S3DataProcessingRuleName",
+    )
+    return [item for page in pages for item in page.get("Items", [])]
+
+
 @tracer.capture_method
 def _process_kb_item(
     item: Dict[str, Any],
-    cdk_kb_ids: set,
-    cdk_rule_names: set,
+    cdk_kb_ids: frozenset[str],
+    cdk_rule_names: frozenset[str],
     processed_kbs: set,
     processed_rules: set,
+    lock: threading.Lock,
+    rules_to_delete: list[str],
     bedrock: BaseClient,
-    events: BaseClient,
 ) -> bool:
     """
     Process a single knowledge base inventory item.
 
+    User-created EventBridge rules are appended to ``rules_to_delete`` rather than
+    deleted inline, so their deletion can be fanned out once all items are known.
+    Safe to call concurrently: KB and rule de-duplication goes through ``lock``.
+
     Returns:
         bool: True if resource was cleaned up, False if preserved
     """
@@ -92,38 +165,40 @@ def _process_kb_item(
     data_source_id = item.get("DataSourceId")
     rule_name = item.get("S3DataProcessingRuleName")
 
-    logger.info(
-        "Processing KB item",
-        extra={
-            "kbProcessing": {
-                "knowledgeBaseId": kb_id,
-                "dataSourceId": data_source_id,
-                "ruleName": rule_name,
-            }
-        },
-    )
-
-    # Check if this is an IaC-managed knowledge base (by KB ID)
+    # Check if this is an IaC-managed knowledge base (by KB ID) before any
+    # structured logging, since nothing is mutated for these items
     if kb_id in cdk_kb_ids:
-        logger.info(f"Preserving IaC-managed knowledge base: {kb_id}")
+        logger.debug("Preserving IaC-managed knowledge base: %s", kb_id)
         return False  # Resource preserved
 
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Processing KB item",
+            extra={
+                "kbProcessing": {
+                    "knowledgeBaseId": kb_id,
+                    "dataSourceId": data_source_id,
+                    "ruleName": rule_name,
+                }
+            },
+        )
+
     # This is a user-created knowledge base - clean it up
-    logger.info(f"Cleaning up user-created knowledge base: {kb_id}")
+    logger.info("Cleaning up user-created knowledge base: %s", kb_id)
 
     # Handle knowledge base deletion (avoid duplicates)
-    if kb_id not in processed_kbs:
+    if _claim(processed_kbs, kb_id, lock):
         try:
             # Check KB status before attempting deletion
-            logger.info(f"Checking status of knowledge base: {kb_id}")
+            logger.info("Checking status of knowledge base: %s", kb_id)
             kb_info = bedrock.get_knowledge_base(knowledgeBaseId=kb_id)
             status = kb_info["knowledgeBase"]["status"]
 
             if status == "ACTIVE":
                 # Delete the knowledge base
-                logger.info(f"Deleting knowledge base: {kb_id}")
+                logger.info("Deleting knowledge base: %s", kb_id)
                 bedrock.delete_knowledge_base(knowledgeBaseId=kb_id)
-                logger.info(f"Successfully deleted knowledge base: {kb_id}")
+                logger.info("Successfully deleted knowledge base: %s", kb_id)
             elif status in [
                 "CREATING",
                 "DELETING",
@@ -131,14 +206,12 @@ def _process_kb_item(
                 "FAILED",
                 "DELETE_UNSUCCESSFUL",
             ]:
-                logger.info(f"Skipping KB {kb_id} - status:{status}")
+                logger.info("Skipping KB %s - status:%s", kb_id, status)
             else:
                 logger.warning(
                     f"KB {kb_id} in unexpected status: {status}, skipping deletion"
                 )
 
-            processed_kbs.add(kb_id)
-
         except ClientError as e:
             logger.warning(
                 "Failed to delete knowledge base. KB might have already been deleted.",
@@ -150,97 +223,92 @@ def _process_kb_item(
                     }
                 },
             )
-            processed_kbs.add(kb_id)  # Mark as processed to avoid retry
     else:
-        logger.info(f"Skipping already processed knowledge base: {kb_id}")
+        logger.info("Skipping already processed knowledge base: %s", kb_id)
 
-    # Handle EventBridge rule deletion (avoid duplicates)
+    # Queue EventBridge rule deletion (avoid duplicates)
     # Only delete rules that are NOT CDK-created (exact name matching)
-    if rule_name and rule_name not in processed_rules:
+    if rule_name and _claim(processed_rules, rule_name, lock):
         # Check if this is an IaC-managed rule (by exact rule name)
         if rule_name in cdk_rule_names:
-            logger.info(f"Preserving IaC-managed EventBridge rule: {rule_name}")
+            logger.info("Preserving IaC-managed EventBridge rule: %s", rule_name)
         else:
-            # This is a user-created rule - delete it
-            try:
-                logger.info(f"Deleting user-created EventBridge rule: {rule_name}")
-
-                # First, remove all targets from the rule
-                try:
-                    targets_response = events.list_targets_by_rule(Rule=rule_name)
-                    if targets_response.get("Targets"):
-                        target_ids = [
-                            target["Id"] for target in targets_response["Targets"]
-                        ]
-                        events.remove_targets(Rule=rule_name, Ids=target_ids)
-                        logger.info(f"Removed targets from rule: {rule_name}")
-                except ClientError as e:
-                    logger.error(
-                        "Failed to remove targets from rule",
-                        extra={
-                            "targetRemovalError": {
-                                "ruleName": rule_name,
-                                "error": str(e),
-                                "errorCode": e.response.get("Error", {}).get("Code"),
-                            }
-                        },
-                    )
+            # This is a user-created rule - delete it once all items are processed
+            rules_to_delete.append(rule_name)
+    elif rule_name:
+        logger.info("Skipping already processed EventBridge rule: %s", rule_name)
 
-                # Then delete the rule
-                events.delete_rule(Name=rule_name)
-                logger.info(f"Successfully deleted EventBridge rule: {rule_name}")
+    return True  # Increment cleanup count, no preserved count increment
 
-            except ClientError as e:
-                logger.error(
-                    "Failed to delete EventBridge rule",
-                    extra={
-                        "deletionError": {
-                            "ruleName": rule_name,
-                            "error": str(e),
-                            "errorCode": e.response.get("Error", {}).get("Code"),
-                        }
-                    },
-                )
-                # Continue with other cleanup operations
 
-        processed_rules.add(rule_name)
-    elif rule_name:
-        logger.info(f"Skipping already processed EventBridge rule: {rule_name}")
+@tracer.capture_method
+def _delete_rule(rule_name: str, events: BaseClient) -> None:
+    """Remove the targets of a user-created EventBridge rule, then delete it."""
+    try:
+        logger.info("Deleting user-created EventBridge rule: %s", rule_name)
 
-    return True  # Increment cleanup count, no preserved count increment
+        # First, remove all targets from the rule
+        try:
+            targets_response = events.list_targets_by_rule(Rule=rule_name)
+            if targets_response.get("Targets"):
+                target_ids = [target["Id"] for target in targets_response["Targets"]]
+                events.remove_targets(Rule=rule_name, Ids=target_ids)
+                logger.info("Removed targets from rule: %s", rule_name)
+        except ClientError as e:
+            logger.error(
+                "Failed to remove targets from rule",
+                extra={
+                    "targetRemovalError": {
+                        "ruleName": rule_name,
+                        "error": str(e),
+                        "errorCode": e.response.get("Error", {}).get("Code"),
+                    }
+                },
+            )
+
+        # Then delete the rule
+        events.delete_rule(Name=rule_name)
+        logger.info("Successfully deleted EventBridge rule: %s", rule_name)
+
+    except ClientError as e:
+        logger.error(
+            "Failed to delete EventBridge rule",
+            extra={
+                "deletionError": {
+                    "ruleName": rule_name,
+                    "error": str(e),
+                    "errorCode": e.response.get("Error", {}).get("Code"),
+                }
+            },
+        )
+        # Continue with other cleanup operations
+
+
+def _is_application_resource(resource_arn: str) -> bool:
+    """Check whether an AgentCore resource was created from the application.
+
+    Such resources carry this deployment's Environment and Stack tags but are not
+    owned by the IaC tool. Runs on the worker threads, so only matches reach the
+    deletion loop.
+    """
+    response = BAC_CLIENT.list_tags_for_resource(resourceArn=resource_arn)
+    tags = response.get("tags", {})
+    return (
+        tags.get("Environment", "_aca") == ENVIRONMENT_TAG
+        and tags.get("Stack", "_tag") == STACK_TAG
+        and tags.get("Owner") != IAC_OWNER_TAG
+    )
 
 
 @tracer.capture_method
 def _remove_runtimes() -> None:
-    @dataclass
-    class Runtime:
-        arn: str
-        identifier: str
-
     try:
-        agent_runtimes: list[Runtime] = []
-
-        response = BAC_CLIENT.list_agent_runtimes(maxResults=100)
-        agent_runtimes.extend(
-            [
-                Runtime(
-                    arn=elem.get("agentRuntimeArn", ""),
-                    identifier=elem.get("agentRuntimeId", ""),
-                )
-                for elem in response.get("agentRuntimes", [])
-            ]
-        )
-        while response.get("nextToken"):
-            response = BAC_CLIENT.list_agent_runtimes(maxResults=100)
-            agent_runtimes.extend(
-                [
-                    Runtime(
-                        arn=elem.get("agentRuntimeArn", ""),
-                        identifier=elem.get("agentRuntimeId", ""),
-                    )
-                    for elem in response.get("agentRuntimes", [])
-                ]
-            )
+        paginator = BAC_CLIENT.get_paginator("list_agent_runtimes")
+        pages = paginator.paginate(PaginationConfig={"PageSize": 100})
+        agent_runtimes = [
+            Runtime._make(row)
+            for row in pages.search("agentRuntimes[].[agentRuntimeArn, agentRuntimeId]")
+        ]
     except ClientError as err:
         logger.error(
             "Failed to fetch AgentCore Runtimes", extra={"rawErrorMessage": str(err)}
@@ -250,24 +318,27 @@ def _remove_runtimes() -> None:
 
     logger.info(f"Retrieved {len(agent_runtimes)} AgentCore runtimes")
 
-    for runtime in agent_runtimes:
-        try:
-            response = BAC_CLIENT.list_tags_for_resource(resourceArn=runtime.arn)
-            tags = response.get("tags", {})
-        except ClientError as err:
-            logger.error(
-                f"Failed to get tags of {runtime.identifier} to check if needs to be deleted",
-                extra={"rawErrorMessage": str(err)},
-            )
-            logger.warning("Continuing with stack deletion despite cleanup errors")
-            continue
+    with ThreadPoolExecutor(max_workers=TAG_LOOKUP_WORKERS) as executor:
+        tag_futures = {
+            executor.submit(_is_application_resource, runtime.arn): runtime
+            for runtime in agent_runtimes
+        }
+        for future in as_completed(tag_futures):
+            runtime = tag_futures[future]
+            try:
+                needs_cleanup = future.result()
+            except ClientError as err:
+                logger.error(
+                    f"Failed to get tags of {runtime.identifier} to check if needs to be deleted",
+                    extra={"rawErrorMessage": str(err)},
+                )
+                logger.warning("Continuing with stack deletion despite cleanup errors")
+                continue
 
-        try:
-            if (
-                tags.get("Environment", "_aca") == ENVIRONMENT_TAG
-                and tags.get("Stack", "_tag") == STACK_TAG
-                and tags.get("Owner") != IAC_OWNER_TAG
-            ):
+            if not needs_cleanup:
+                continue
+
+            try:
                 logger.info(
                     f"Runtime {runtime.identifier} was created from the application and needs cleanup"
                 )
@@ -278,50 +349,23 @@ def _remove_runtimes() -> None:
                     f"Deletion of runtime {runtime.identifier} correctly started"
                 )
 
-            # Environment: dev
-            # Stack: aca
-        except ClientError as err:
-            logger.error(
-                f"Failed to delete {runtime.identifier}",
-                extra={"rawErrorMessage": str(err)},
-            )
-            logger.warning("Continuing with stack deletion despite cleanup errors")
-            continue
+                # Environment: dev
+                # Stack: aca
+            except ClientError as err:
+                logger.error(
+                    f"Failed to delete {runtime.identifier}",
+                    extra={"rawErrorMessage": str(err)},
+                )
+                logger.warning("Continuing with stack deletion despite cleanup errors")
+                continue
 
 
 @tracer.capture_method
 def _remove_memories() -> None:
-    @dataclass
-    class Memory:
-        arn: str
-        identifier: str
-
     try:
-        memories: list[Memory] = []
-
-        response = BAC_CLIENT.list_memories(maxResults=100)
-        memories.extend(
-            [
-                Memory(
-                    arn=elem.get("arn", ""),
-                    identifier=elem.get("id", ""),
-                )
-                for elem in response.get("memories", [])
-            ]
-        )
-        while response.get("nextToken"):
-            response = BAC_CLIENT.list_memories(
-                maxResults=100, nextToken=response["nextToken"]
-            )
-            memories.extend(
-                [
-                    Memory(
-                        arn=elem.get("arn", ""),
-                        identifier=elem.get("id", ""),
-                    )
-                    for elem in response.get("memories", [])
-                ]
-            )
+        paginator = BAC_CLIENT.get_paginator("list_memories")
+        pages = paginator.paginate(PaginationConfig={"PageSize": 100})
+        memories = [Memory._make(row) for row in pages.search("memories[].[arn, id]")]
     except ClientError as err:
         logger.error(
             "Failed to fetch AgentCore Memories", extra={"rawErrorMessage": str(err)}
@@ -331,36 +375,39 @@ def _remove_memories() -> None:
 
     logger.info(f"Retrieved {len(memories)} AgentCore memories")
 
-    for memory in memories:
-        try:
-            response = BAC_CLIENT.list_tags_for_resource(resourceArn=memory.arn)
-            tags = response.get("tags", {})
-        except ClientError as err:
-            logger.error(
-                f"Failed to get tags of {memory.identifier} to check if needs to be deleted",
-                extra={"rawErrorMessage": str(err)},
-            )
-            logger.warning("Continuing with stack deletion despite cleanup errors")
-            continue
+    with ThreadPoolExecutor(max_workers=TAG_LOOKUP_WORKERS) as executor:
+        tag_futures = {
+            executor.submit(_is_application_resource, memory.arn): memory
+            for memory in memories
+        }
+        for future in as_completed(tag_futures):
+            memory = tag_futures[future]
+            try:
+                needs_cleanup = future.result()
+            except ClientError as err:
+                logger.error(
+                    f"Failed to get tags of {memory.identifier} to check if needs to be deleted",
+                    extra={"rawErrorMessage": str(err)},
+                )
+                logger.warning("Continuing with stack deletion despite cleanup errors")
+                continue
 
-        try:
-            if (
-                tags.get("Environment", "_aca") == ENVIRONMENT_TAG
-                and tags.get("Stack", "_tag") == STACK_TAG
-                and tags.get("Owner") != IAC_OWNER_TAG
-            ):
+            if not needs_cleanup:
+                continue
+
+            try:
                 logger.info(
                     f"Memory {memory.identifier} was created from the application and needs cleanup"
                 )
                 BAC_CLIENT.delete_memory(memoryId=memory.identifier)
                 logger.info(f"Deletion of memory {memory.identifier} correctly started")
-        except ClientError as err:
-            logger.error(
-                f"Failed to delete {memory.identifier}",
-                extra={"rawErrorMessage": str(err)},
-            )
-            logger.warning("Continuing with stack deletion despite cleanup errors")
-            continue
+            except ClientError as err:
+                logger.error(
+                    f"Failed to delete {memory.identifier}",
+                    extra={"rawErrorMessage": str(err)},
+                )
+                logger.warning("Continuing with stack deletion despite cleanup errors")
+                continue
 
 
 @tracer.capture_method
@@ -368,7 +415,7 @@ def on_delete():
     logger.info("Running cleanup during stack deletion")
 
     # Skip KB cleanup if KB feature is not enabled
-    if not KB_ENABLED or KB_TABLE is None:
+    if not KB_ENABLED:
         logger.info("Knowledge Base feature not enabled, skipping KB cleanup")
     else:
         try:
@@ -383,46 +430,58 @@ def on_delete():
                 },
             )
 
+            dynamodb = _dynamodb_resource().meta.client
+            bedrock = _bedrock_agent_client()
+            events = _events_client()
+
             # Scan the knowledge base inventory table
             logger.info("Scanning knowledge base inventory table")
-            response = KB_TABLE.scan()
+            with ThreadPoolExecutor(max_workers=KB_SCAN_SEGMENTS) as executor:
+                items = [
+                    item
+                    for segment_items in executor.map(
+                        functools.partial(_scan_segment, dynamodb),
+                        range(KB_SCAN_SEGMENTS),
+                    )
+                    for item in segment_items
+                ]
 
-            cleanup_count = 0
             processed_kbs = set()  # Track processed KBs to avoid duplicates
             processed_rules = set()  # Track processed rules to avoid duplicates
+            rules_to_delete: list[str] = []
+            lock = threading.Lock()
 
-            for item in response["Items"]:
-                resource_cleaned = _process_kb_item(
-                    item,
-                    IAC_KNOWLEDGE_BASE_IDS,
-                    IAC_RULE_NAMES,
-                    processed_kbs,
-                    processed_rules,
-                    BEDROCK_AGENT_CLIENT,
-                    EVENTS_CLIENT,
-                )
-                cleanup_count += resource_cleaned
-
-            # Handle pagination if there are more items
-            while "LastEvaluatedKey" in response:
-                logger.info("Scanning next page of knowledge base inventory")
-                response = KB_TABLE.scan(ExclusiveStartKey=response["LastEvaluatedKey"])
-
-                for item in response["Items"]:
-                    resource_cleaned = _process_kb_item(
+            with ThreadPoolExecutor(max_workers=KB_CLEANUP_WORKERS) as executor:
+                futures = {
+                    executor.submit(
+                        _process_kb_item,
                         item,
                         IAC_KNOWLEDGE_BASE_IDS,
                         IAC_RULE_NAMES,
                         processed_kbs,
                         processed_rules,
-                        BEDROCK_AGENT_CLIENT,
-                        EVENTS_CLIENT,
-                    )
-                    cleanup_count += resource_cleaned
+                        lock,
+                        rules_to_delete,
+                        bedrock,
+                    ): item
+                    for item in items
+                }
+                cleaned_kb_ids = [
+                    futures[future]["KnowledgeBaseId"]
+                    for future in as_completed(futures)
+                    if future.result()
+                ]
+
+                # Rules are independent of each other, so their
+                # list_targets -> remove_targets -> delete_rule chains overlap
+                for future in as_completed(
+                    executor.submit(_delete_rule, rule_name, events)
+                    for rule_name in rules_to_delete
+                ):
+                    future.result()
 
-            # Calculate preserved count
-            total_items = len(response.get("Items", []))
-            preserved_count = total_items - cleanup_count
+            cleanup_count = len(cleaned_kb_ids)
+            preserved_count = len(items) - cleanup_count
 
             logger.info(
                 "KB cleanup completed successfully",
@@ -430,6 +489,7 @@ def on_delete():
                     "cleanupSummary": {
                         "cleanedUp": cleanup_count,
                         "preserved": preserved_count,
+                        "cleanedKnowledgeBaseIds": sorted(set(cleaned_kb_ids)),
                     }
                 },
             )
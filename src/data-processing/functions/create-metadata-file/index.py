@@ -4,16 +4,15 @@
 # SPDX-License-Identifier: MIT-0
 #
 # ----------------------------------------------------------------------- #
-import json
 import os
-from decimal import Decimal
-from pathlib import Path
 from typing import Mapping
 
 import boto3
+import orjson
 from aws_lambda_powertools import Logger, Tracer
 from aws_lambda_powertools.utilities.parser import BaseModel, event_parser
 from botocore.exceptions import ClientError
+from genai_core.clients import CLIENT_CONFIG
 from genai_core.data.dynamo import DocumentStore
 from genai_core.exceptions import AcaException
 
@@ -27,7 +26,8 @@ tracer = Tracer(service="aca-dataProcessing-createMetadataFile")
 # -------------------------------------------------------------------- #
 
 # --------------------------- AWS CLIENTS ---------------------------- #
-S3_RESOURCE = boto3.resource("s3")
+S3_CLIENT = boto3.client("s3", config=CLIENT_CONFIG)
+DOC_STORE = DocumentStore(table_name=TABLE_NAME, logger=logger)
 # -------------------------------------------------------------------- #
 
 
@@ -63,13 +63,6 @@ class OutputModel(BaseModel):
     metadataKey: str
 
 
-class Encoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, Decimal):
-            return str(obj)
-        return super(Encoder, self).default(obj)
-
-
 @event_parser(model=InputModel)
 @tracer.capture_lambda_handler
 def handler(event: InputModel, _) -> Mapping:
@@ -90,10 +83,9 @@ def handler(event: InputModel, _) -> Mapping:
         f"Initializing creation of the metadata associated with the document {event.documentId}"
     )
 
-    logger.info(f"Connecting document store to table {TABLE_NAME}")
+    logger.info(f"Reading document from table {TABLE_NAME}")
     try:
-        doc_store = DocumentStore(table_name=TABLE_NAME, logger=logger)
-        record = doc_store.get_document(event.documentId)
+        record = DOC_STORE.get_document(event.documentId)
         if record is None:
             raise AcaException(
                 f"The document {event.documentId} is not part of the dynamoDB table"
@@ -112,28 +104,28 @@ def handler(event: InputModel, _) -> Mapping:
         )
     else:
         logger.info(
-            f"Metadata associated with {event.documentId}: {json.dumps(doc_metadata, default=str)}"
+            f"Metadata associated with {event.documentId}: {orjson.dumps(doc_metadata, default=str).decode()}"
         )
 
     indexed_key = f"{event.prefixDataSource}/{event.documentId}{event.extension}"
     logger.info(f"Indexed key {indexed_key}")
-    parts = Path(event.key).parts
-    if len(parts) > 0:
+    if event.key:
+        # The document name is the key without its top-level prefix
+        _, sep, document_name = event.key.partition("/")
         metadata_file_content = {
             "metadataAttributes": {
-                "documentName": "/".join(parts[1:]) if len(parts) > 1 else parts[0],
+                "documentName": document_name if sep else event.key,
                 **doc_metadata,
             }
         }
     else:
         metadata_file_content = {}
     metadata_key = f"{indexed_key}.metadata.json"
-    s3_object = S3_RESOURCE.Object(event.bucket, metadata_key)  # type: ignore # this is correct is just that pylint cannot access boto3 resources
     try:
-        s3_object.put(
-            Body=(
-                bytes(json.dumps(metadata_file_content, cls=Encoder).encode("UTF-8"))
-            ),
+        S3_CLIENT.put_object(
+            Bucket=event.bucket,
+            Key=metadata_key,
+            Body=orjson.dumps(metadata_file_content, default=str),
             ContentType="application/json",
         )
     except ClientError as err:
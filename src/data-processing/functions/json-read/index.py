@@ -4,11 +4,11 @@
 # SPDX-License-Identifier: MIT-0
 #
 # ----------------------------------------------------------------------- #
-import json
-
 import boto3
+import orjson
 from aws_lambda_powertools import Logger, Tracer
 from aws_lambda_powertools.utilities.parser import BaseModel, event_parser
+from botocore.config import Config
 
 # ------------------------- Lambda Powertools ------------------------ #
 logger = Logger(service="aca-dataProcessing-readJson")
@@ -16,7 +16,13 @@ tracer = Tracer(service="aca-dataProcessing-readJson")
 # -------------------------------------------------------------------- #
 
 # --------------------------- AWS CLIENTS ---------------------------- #
-S3_CLIENT = boto3.client("s3")
+CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    connect_timeout=3,
+    read_timeout=30,
+    retries={"max_attempts": 5, "mode": "adaptive"},
+)
+S3_CLIENT = boto3.client("s3", config=CLIENT_CONFIG)
 # -------------------------------------------------------------------- #
 
 
@@ -63,12 +69,12 @@ def handler(event: InputModel, _):
     logger.info(f"Document key out: {event.keyOut}")
 
     file_object = S3_CLIENT.get_object(Bucket=event.bucket, Key=event.keyIn)
-    file_json = json.loads(file_object.get("Body").read().decode("utf-8"))
+    file_json = orjson.loads(file_object["Body"].read())
     file_str = file_json["text"]
     file_metadata = file_json.get("metadata", {})
 
     S3_CLIENT.put_object(
-        Body=file_str,
+        Body=file_str.encode("utf-8"),
         Bucket=event.bucket,
         Key=event.keyOut,
         ContentType="text/plain",
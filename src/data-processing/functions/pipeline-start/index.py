@@ -4,26 +4,27 @@
 # SPDX-License-Identifier: MIT-0
 #
 # ----------------------------------------------------------------------- #
-import json
 import os
-import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from pathlib import Path
 
 import boto3
+import orjson
 from aws_lambda_powertools import Logger, Tracer
 from aws_lambda_powertools.utilities.data_classes import (
     SQSEvent,
     event_source,
 )
 from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
-from aws_lambda_powertools.utilities.parser import BaseModel, parse
+from aws_lambda_powertools.utilities.parser import BaseModel
 from aws_lambda_powertools.utilities.typing import LambdaContext
+from genai_core.clients import CLIENT_CONFIG
 from genai_core.processing.types import (
     BEDROCK_KB_SUPPORTED_OFFICE_EXTENSIONS,
     VIDEO_EXTENSIONS,
 )
 from genai_core.processing.utils import generate_doc_hash
+from pydantic import ConfigDict
 
 # ------------------------- Lambda Powertools ------------------------ #
 logger = Logger(service="aca-dataProcessing-startPipeline")
@@ -31,7 +32,7 @@ tracer = Tracer(service="aca-dataProcessing-startPipeline")
 # -------------------------------------------------------------------- #
 
 # --------------------------- AWS CLIENTS ---------------------------- #
-SFN_CLIENT = boto3.client("stepfunctions")
+SFN_CLIENT = boto3.client("stepfunctions", config=CLIENT_CONFIG)
 # -------------------------------------------------------------------- #
 
 # ------------------------- Environment Variables ------------------------ #
@@ -49,6 +50,9 @@ DOCUMENT_TYPE_MAPPING = {
     ".pdf": "PDF",
     ".json": "JSON",
 }
+
+# Records of an SQS batch processed concurrently
+PROCESS_RECORD_WORKERS = 8
 # -------------------------------------------------------------------- #
 
 
@@ -78,6 +82,8 @@ class OutputModel(BaseModel):
 
     """
 
+    model_config = ConfigDict(strict=True, frozen=True)
+
     documentId: str
     documentType: str
     documentExtension: str
@@ -101,10 +107,9 @@ class OutputModel(BaseModel):
 
 @tracer.capture_method
 def extract_object_name(object_key, prefix):
-    pattern = f"^{re.escape(prefix)}/(.+)$"
-    match = re.search(pattern, object_key)
-    if match:
-        return match.group(1)
+    needle = f"{prefix}/"
+    if object_key.startswith(needle) and len(object_key) > len(needle):
+        return object_key[len(needle) :]
     else:
         raise AssertionError(
             f"Object key '{object_key}' should match expected pattern with prefix '{prefix}' by state machine design"
@@ -131,6 +136,8 @@ class InputModel(BaseModel):
         languageCode (str): Language code (e.g. for transcribe),
     """
 
+    model_config = ConfigDict(strict=True, frozen=True)
+
     bucket: str
     key: str
     s3RequestTimestamp: str
@@ -158,19 +165,22 @@ def process_record(record: SQSRecord) -> OutputModel:
         OutputModel: Dictionary containing record information
     """
 
-    payload = parse(record.json_body, InputModel)
-    logger.info(payload)
+    payload = InputModel.model_validate_json(record.body)
 
-    logger.info(f"Bucket that contains the document: {payload.bucket}")
-    logger.info(f"Document key: {payload.key}")
-
-    extension = Path(payload.key).suffix
-    document_type = DOCUMENT_TYPE_MAPPING.get(extension, "UNKNOWN")
-    logger.info(f"Document type is {document_type}")
+    extension = os.path.splitext(payload.key)[1]
+    document_type = DOCUMENT_TYPE_MAPPING.get(extension.lower(), "UNKNOWN")
     document_id = generate_doc_hash(payload.key, 0)
-    logger.info(f"Document ID is {document_id}")
     object_name = extract_object_name(payload.key, payload.prefixInput)
-    logger.info(f"Object name is {object_name}")
+    logger.info(
+        "Processed record",
+        extra={
+            "bucket": payload.bucket,
+            "key": payload.key,
+            "documentType": document_type,
+            "documentId": document_id,
+            "objectName": object_name,
+        },
+    )
 
     return OutputModel(
         documentId=document_id,
@@ -213,7 +223,10 @@ def handler(event: SQSEvent, _: LambdaContext):
     messages = event.raw_event["Records"]
     logger.info(f"Messages received: {len(messages)}")
 
-    documents = [process_record(record=SQSRecord(record)) for record in messages]
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(PROCESS_RECORD_WORKERS, len(messages)))
+    ) as executor:
+        documents = list(executor.map(process_record, map(SQSRecord, messages)))
     documents = [
         doc for doc in documents if doc.key[-1] != "/"
     ]  # filter out folders objects
@@ -227,7 +240,8 @@ def handler(event: SQSEvent, _: LambdaContext):
 
         SFN_CLIENT.start_execution(
             stateMachineArn=STATE_MACHINE_ARN,
-            input=json.dumps([d.model_dump() for d in documents]),
+            # OutputModel only holds str fields, so its __dict__ is already JSON ready
+            input=orjson.dumps([d.__dict__ for d in documents]).decode(),
         )
 
         body_returned = f"Number of documents started: {len(documents)}"
@@ -4,12 +4,13 @@
 # SPDX-License-Identifier: MIT-0
 #
 # ----------------------------------------------------------------------- #
-import json
 from datetime import datetime
 
 import boto3
 from aws_lambda_powertools import Logger, Tracer
 from aws_lambda_powertools.utilities.parser import BaseModel, event_parser
+from botocore.config import Config
+from pydantic import ConfigDict
 
 # ------------------------- Lambda Powertools ------------------------ #
 logger = Logger(service="aca-dataProcessing-readTranscribe")
@@ -17,7 +18,13 @@ tracer = Tracer(service="aca-dataProcessing-readTranscribe")
 # -------------------------------------------------------------------- #
 
 # --------------------------- AWS CLIENTS ---------------------------- #
-S3_CLIENT = boto3.client("s3")
+CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    connect_timeout=3,
+    read_timeout=30,
+    retries={"max_attempts": 5, "mode": "adaptive"},
+)
+S3_CLIENT = boto3.client("s3", config=CLIENT_CONFIG)
 # -------------------------------------------------------------------- #
 
 
@@ -31,11 +38,49 @@ class InputModel(BaseModel):
         keyOut (str): Output object key/path of the document in the S3 bucket
     """
 
+    model_config = ConfigDict(strict=True, frozen=True)
+
     bucket: str
     keyIn: str
     keyOut: str
 
 
+class Transcript(BaseModel):
+    """A single transcript entry of an Amazon Transcribe output json.
+
+    Attributes:
+        transcript (str): Full text of the transcript
+    """
+
+    model_config = ConfigDict(strict=True, frozen=True)
+
+    transcript: str
+
+
+class TranscriptResults(BaseModel):
+    """Results section of an Amazon Transcribe output json.
+
+    Attributes:
+        transcripts (list[Transcript]): Transcripts produced by the job
+    """
+
+    model_config = ConfigDict(strict=True, frozen=True)
+
+    transcripts: list[Transcript]
+
+
+class TranscriptFile(BaseModel):
+    """Amazon Transcribe output json, restricted to the fields read by this function.
+
+    Attributes:
+        results (TranscriptResults): Results of the transcription job
+    """
+
+    model_config = ConfigDict(strict=True, frozen=True)
+
+    results: TranscriptResults
+
+
 class OutputModel(BaseModel):
     """Input model for the Lambda function that extracts transcript
         from Amazon Transcribe output json.
@@ -44,6 +89,8 @@ class OutputModel(BaseModel):
         timestamp (str): Timestamp of completion
     """
 
+    model_config = ConfigDict(strict=True, frozen=True)
+
     timestamp: str
 
 
@@ -64,13 +111,13 @@ def handler(event: InputModel, _):
     logger.info(f"Document key out: {event.keyOut}")
 
     transcript_file_object = S3_CLIENT.get_object(Bucket=event.bucket, Key=event.keyIn)
-    transcript_json = json.loads(
-        transcript_file_object.get("Body").read().decode("utf-8")
+    transcript_file = TranscriptFile.model_validate_json(
+        transcript_file_object["Body"].read()
     )
-    transcript_str = transcript_json["results"]["transcripts"][0]["transcript"]
+    transcript_str = transcript_file.results.transcripts[0].transcript
 
     S3_CLIENT.put_object(
-        Body=transcript_str,
+        Body=transcript_str.encode("utf-8"),
         Bucket=event.bucket,
         Key=event.keyOut,
         ContentType="text/plain",
@@ -5,28 +5,33 @@
 # -----------------------------------------------------------------------
 from __future__ import annotations
 
-import codecs
-import json
+import functools
 import os
-import re
+import time
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Optional, Tuple
+from typing import TYPE_CHECKING, Optional
 
 import boto3
+import orjson
 from aws_lambda_powertools import Logger, Tracer
 from aws_lambda_powertools.utilities.data_classes import SNSEvent, event_source
 from aws_lambda_powertools.utilities.parser import BaseModel
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from genai_core.api_helper.message_handler import send_to_client
+from genai_core.api_helper.message_handler import (
+    send_batch_to_client,
+    send_to_client,
+)
 from genai_core.api_helper.types import ChatbotAction
 from genai_core.data.dynamo import ChatHistoryHandler
 from genai_core.exceptions import AcaException
 from genai_core.types import ChatbotMessage, EFramework, ERole
-from pydantic import ValidationError
+from pydantic import ConfigDict, ValidationError
 
 if TYPE_CHECKING:
     from aws_lambda_powertools.utilities.data_classes.sns_event import SNSEventRecord
     from aws_lambda_powertools.utilities.typing import LambdaContext
+    from botocore.client import BaseClient
 
 # ------------------------- Lambda Powertools ----------------------- #
 logger = Logger(service="aca-agentCoreInterface")
@@ -42,13 +47,36 @@ ERROR_MESSAGE = os.environ.get(
 ACCOUNT_ID = os.environ["ACCOUNT_ID"]
 # ------------------------------------------------------------------- #
 
+# ------------------------- Global Variables ------------------------ #
+# Seconds a looked up endpoint live version is reused before asking again
+ENDPOINT_VERSION_TTL = 300
+# (runtime ID, endpoint name) -> (lookup time, live version)
+_ENDPOINT_VERSIONS: dict[tuple[str, str], tuple[float, str]] = {}
+# ------------------------------------------------------------------- #
+
 # --------------------------- AWS CLIENTS ---------------------------- #
-AC_CLIENT = boto3.client("bedrock-agentcore")
-ACR_CLIENT = boto3.client("bedrock-agentcore-control")
+# No read_timeout override: agent responses are streamed and may pause between
+# chunks while the agent runs tools
+CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    connect_timeout=3,
+    retries={"max_attempts": 3, "mode": "standard"},
+)
+AC_CLIENT = boto3.client("bedrock-agentcore", config=CLIENT_CONFIG)
+
+
+# Only run requests resolve the endpoint version, so heartbeats never build it
+@functools.cache
+def _control_client() -> BaseClient:
+    return boto3.client("bedrock-agentcore-control", config=CLIENT_CONFIG)
+
+
 # -------------------------------------------------------------------- #
 
 
 class CallArguments(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     sessionId: str
     messageId: Optional[str] = None
     text: Optional[str] = None
@@ -58,6 +86,8 @@ class CallArguments(BaseModel):
 
 
 class InputModel(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     userId: str
     action: ChatbotAction
     data: CallArguments
@@ -81,6 +111,33 @@ def load_record(record: SNSEventRecord) -> InputModel:
     return payload
 
 
+def _get_live_version(runtime_id: str, qualifier: str) -> str:
+    """Return the live version of an agent runtime endpoint.
+
+    Lookups are cached per endpoint for ENDPOINT_VERSION_TTL seconds so that
+    consecutive turns of a conversation do not each call the control plane.
+
+    Args:
+        runtime_id (str): Agent runtime identifier
+        qualifier (str): Name of the agent runtime endpoint
+
+    Returns:
+        str: Live version of the endpoint, "??" when unknown
+    """
+    now = time.monotonic()
+    cached = _ENDPOINT_VERSIONS.get((runtime_id, qualifier))
+    if cached and now - cached[0] < ENDPOINT_VERSION_TTL:
+        return cached[1]
+
+    version = (
+        _control_client()
+        .get_agent_runtime_endpoint(agentRuntimeId=runtime_id, endpointName=qualifier)
+        .get("liveVersion", "??")
+    )
+    _ENDPOINT_VERSIONS[(runtime_id, qualifier)] = (now, version)
+    return version
+
+
 @tracer.capture_method
 def handle_heartbeat(record: InputModel) -> None:
     """Send heartbeat response to client.
@@ -91,12 +148,12 @@ def handle_heartbeat(record: InputModel) -> None:
     if record.data.agentRuntimeId and record.data.qualifier:
         logger.info("Sending heartbeat to AC runtime for warming up the session")
         try:
-            payload = json.dumps(
+            payload = orjson.dumps(
                 {
                     "isHeartbeat": True,
                     "userId": record.userId,
                 }
-            ).encode()
+            )
 
             AC_CLIENT.invoke_agent_runtime(
                 agentRuntimeArn=record.data.agentRuntimeId,
@@ -162,10 +219,9 @@ def handle_run(record: InputModel) -> None:
         },
     )
 
-    runtime_version = ACR_CLIENT.get_agent_runtime_endpoint(
-        agentRuntimeId=record.data.agentRuntimeId,
-        endpointName=record.data.qualifier,
-    ).get("liveVersion", "??")
+    runtime_version = _get_live_version(
+        record.data.agentRuntimeId, record.data.qualifier
+    )
 
     logger.info(
         "Agent Configuration",
@@ -186,7 +242,7 @@ def handle_run(record: InputModel) -> None:
         if record.data.state is not None:
             payload_dict["state"] = record.data.state
 
-        payload = json.dumps(payload_dict).encode()
+        payload = orjson.dumps(payload_dict)
 
         response = AC_CLIENT.invoke_agent_runtime(
             agentRuntimeArn=record.data.agentRuntimeId,
@@ -197,15 +253,20 @@ def handle_run(record: InputModel) -> None:
             accountId=ACCOUNT_ID,
         )
 
-        # Use incremental decoder to handle UTF-8 characters split across chunk boundaries
-        utf8_decoder = codecs.getincrementaldecoder("utf-8")(errors="strict")
-        buffer = ""
+        # Events are newline-terminated, and a newline byte never occurs inside a
+        # multi-byte UTF-8 sequence, so complete lines can be decoded on their own
+        buffer = bytearray()
         response_data = dict()
         for chunk in response.get("response", []):
-            # final=False allows incomplete UTF-8 sequences at end of chunk
-            decoded_text = utf8_decoder.decode(chunk, final=False)
-            events, buffer = parse_events(buffer + decoded_text)
-            logger.debug(f"Events: {events}")
+            buffer.extend(chunk)
+            complete_until = buffer.rfind(b"\n") + 1
+            if not complete_until:
+                continue
+            events = parse_events(buffer[:complete_until].decode("utf-8"))
+            del buffer[:complete_until]
+            logger.debug("Parsed events", extra={"events": events})
+            # Events decoded from the same chunk are published together
+            to_send = []
             for event in events:
                 if event.get("action") == "final_response":
                     response_data = event.get("data", {})
@@ -213,28 +274,13 @@ def handle_run(record: InputModel) -> None:
                         "The agent returned a final response", extra={"event": event}
                     )
                 elif event.get("error"):
+                    send_batch_to_client(to_send)
                     logger.error(event["error"])
                     raise AcaException(event["error"])
                 else:
                     logger.debug("Parsed event", extra={"event": event})
-                send_to_client(event)
-
-        # Flush any remaining bytes from the decoder
-        final_text = utf8_decoder.decode(b"", final=True)
-        if final_text:
-            events, buffer = parse_events(buffer + final_text)
-            for event in events:
-                if event.get("action") == "final_response":
-                    response_data = event.get("data", {})
-                    logger.info(
-                        "The agent returned a final response", extra={"event": event}
-                    )
-                elif event.get("error"):
-                    logger.error(event["error"])
-                    raise AcaException(event["error"])
-                else:
-                    logger.debug("Parsed event", extra={"event": event})
-                send_to_client(event)
+                to_send.append(event)
+            send_batch_to_client(to_send)
     except ClientError as err:
         err_msg = "Failed to invoke agent with AgentCore Runtime"
         logger.error(
@@ -256,32 +302,48 @@ def handle_run(record: InputModel) -> None:
 
 
 @tracer.capture_method
-def parse_events(stream: str) -> Tuple[list[dict], str]:
+def parse_events(stream: str) -> list[dict]:
     """Parse events from stream and extract JSON events.
 
+    Events are ``data: {...}`` lines, so the stream is scanned once line by line
+    instead of searching it repeatedly with a regex.
+
     Args:
-        stream (str): Raw stream data
+        stream (str): Raw stream data made of complete lines
 
     Returns:
-        Tuple[list[dict], str]: Parsed events and remaining unparsed data
+        list[dict]: Parsed events
     """
     parsed_events = []
-    unparsed_data = stream
 
-    while True:
-        event_match = re.search(r"data: ({.*?})\n", unparsed_data)
-        if not event_match:
-            break
+    for line in stream.split("\n"):
+        if not line.startswith("data: {"):
+            continue
         try:
-            parsed_events.append(json.loads(event_match.group(1)))
-            unparsed_data = (
-                unparsed_data[: event_match.start()]
-                + unparsed_data[event_match.end() :]
-            )
-        except json.JSONDecodeError:
-            break
+            parsed_events.append(orjson.loads(line[6:]))
+        except orjson.JSONDecodeError:
+            logger.warning("Skipping malformed event", extra={"rawEvent": line})
+
+    return parsed_events
 
-    return parsed_events, unparsed_data
+
+@functools.lru_cache(maxsize=128)
+def _get_history_handler(session_id: str, user_id: str) -> ChatHistoryHandler:
+    """Return the chat history handler of a session, reused across warm invocations.
+
+    Args:
+        session_id (str): Chatbot session identifier
+        user_id (str): Identifier of the user owning the session
+
+    Returns:
+        ChatHistoryHandler: Handler bound to the session
+    """
+    return ChatHistoryHandler(
+        table_name=SESSION_TABLE,
+        session_id=session_id,
+        user_id=user_id,
+        logger=logger,
+    )
 
 
 @tracer.capture_method
@@ -314,12 +376,7 @@ def save_conversation_exchange(
             "Method called from inside handle_run --> messageId cannot be None"
         )
 
-    history_handler = ChatHistoryHandler(
-        table_name=SESSION_TABLE,
-        session_id=record.data.sessionId,
-        user_id=record.userId,
-        logger=logger,
-    )
+    history_handler = _get_history_handler(record.data.sessionId, record.userId)
     if not record.data.text:
         raise AssertionError("record.data.text cannot be None at this stage")
     user_prompt = ChatbotMessage.init_from_string(
@@ -328,21 +385,17 @@ def save_conversation_exchange(
     assistant_response = ChatbotMessage.init_from_string(
         messageId=record.data.messageId, message=ai_response, role=ERole.ASSISTANT
     )
-    history_handler.add_message_to_chat(
-        message=user_prompt,
-        render=True,
-        runtime_id=runtime_id,
-        runtime_version=runtime_version,
-        endpoint_name=endpoint_name,
-    )
-
-    parsed_refs = json.loads(references) if references else None
-    history_handler.add_message_to_chat(
-        message=assistant_response,
+    parsed_refs = orjson.loads(references) if references else None
+    history_handler.add_exchange_to_chat(
+        user_message=user_prompt,
+        assistant_message=assistant_response,
         render=True,
         references=parsed_refs,
         reasoning_content=reasoning_content,
         structured_output=structured_output,
+        runtime_id=runtime_id,
+        runtime_version=runtime_version,
+        endpoint_name=endpoint_name,
     )
 
 
@@ -9,11 +9,13 @@ This is a placeholder implementation that logs the message content.
 """
 from __future__ import annotations
 
+import os
 from typing import TYPE_CHECKING, Any
 
 import boto3
 from aws_lambda_powertools import Logger, Tracer
 from aws_lambda_powertools.utilities.data_classes import SNSEvent, event_source
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from genai_core.api_helper.message_handler import send_to_client
 from pydantic import BaseModel
@@ -26,7 +28,17 @@ if TYPE_CHECKING:
 logger = Logger(service="aca-agentToolsHandler")
 tracer = Tracer(service="aca-agentToolsHandler")
 # ------------------------------------------------------------------- #
-CLIENT = boto3.client("bedrock-runtime")
+
+# --------------------------- AWS CLIENTS ---------------------------- #
+# Keep the pooled Bedrock connection alive between warm invocations, so only
+# the first call of a container pays for the TLS handshake
+CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    connect_timeout=3,
+    retries={"max_attempts": 3, "mode": "standard"},
+)
+CLIENT = boto3.client("bedrock-runtime", config=CLIENT_CONFIG)
+# -------------------------------------------------------------------- #
 
 SYS_PROMPT = """You are a UI assistant that explains agent actions to non-technical users.
 
@@ -53,6 +65,15 @@ Examples:
 Respond with only the description text, nothing else.
 """
 MODEL_ID = "mistral.ministral-3-8b-instruct"
+# Latency-optimized inference is only available for some models and regions,
+# so it is opt-in through BEDROCK_LATENCY_OPTIMIZED=true for a supported MODEL_ID
+PERFORMANCE_CONFIG = {
+    "latency": (
+        "optimized"
+        if os.environ.get("BEDROCK_LATENCY_OPTIMIZED", "").lower() == "true"
+        else "standard"
+    )
+}
 
 
 class Parameter(BaseModel):
@@ -119,6 +140,7 @@ def process_record(record: SNSEventRecord) -> None:
             messages=messages,
             system=[{"text": SYS_PROMPT}],
             inferenceConfig={"maxTokens": 1024, "temperature": 0.2},
+            performanceConfig=PERFORMANCE_CONFIG,
         )
         tool_action = response["output"]["message"]["content"][0]["text"]
 
@@ -5,33 +5,44 @@
 #
 # ----------------------------------------------------------------------- #
 import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
 from aws_lambda_powertools import Logger, Tracer
-from aws_lambda_powertools.utilities.batch import (
-    BatchProcessor,
-    EventType,
-    process_partial_response,
-)
 from aws_lambda_powertools.utilities.data_classes.sqs_event import SQSRecord
-from aws_lambda_powertools.utilities.parser import BaseModel, parse
+from aws_lambda_powertools.utilities.parser import BaseModel
 from aws_lambda_powertools.utilities.typing import LambdaContext
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from pydantic import ValidationError
 
 # ------------------------- Lambda Powertools ------------------------ #
 logger = Logger(service="aca-knowledgeBase-sync")
 tracer = Tracer(service="aca-knowledgeBase-sync")
-processor = BatchProcessor(event_type=EventType.SQS)
 # -------------------------------------------------------------------- #
 
 # ------------------------- Environment Variables ------------------------ #
 KNOWLEDGEBASE_TABLE_NAME = os.environ.get("KNOWLEDGEBASE_TABLE_NAME", "Table???")
 # -------------------------------------------------------------------- #
 
+# ------------------------- Global Variables ------------------------ #
+# Data sources of a batch synced concurrently
+SYNC_WORKERS = 4
+# -------------------------------------------------------------------- #
+
 # --------------------------- AWS CLIENTS ---------------------------- #
-bedrock_agent = boto3.client("bedrock-agent")
-dynamodb = boto3.resource("dynamodb")
-KNOWLEDGEBASE_TABLE = dynamodb.Table(KNOWLEDGEBASE_TABLE_NAME)
+CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    connect_timeout=3,
+    read_timeout=30,
+    retries={"max_attempts": 3, "mode": "standard"},
+)
+bedrock_agent = boto3.client("bedrock-agent", config=CLIENT_CONFIG)
+dynamodb = boto3.resource("dynamodb", config=CLIENT_CONFIG)
+# Data sources are synced on worker threads: use the resource's low-level client,
+# which is thread-safe and still takes native Python types, not a shared Table
+DYNAMODB_CLIENT = dynamodb.meta.client
 # -------------------------------------------------------------------- #
 
 
@@ -52,12 +63,10 @@ def process_request(
         key (str): S3 key of the triggering document
     """
 
-    if key[-1] == "/":
-        return
-
     # check if request is not expired
     try:
-        KNOWLEDGEBASE_TABLE.update_item(
+        DYNAMODB_CLIENT.update_item(
+            TableName=KNOWLEDGEBASE_TABLE_NAME,
             Key={
                 "KnowledgeBaseId": knowledgeBaseId,
                 "DataSourceId": dataSourceId,
@@ -95,7 +104,8 @@ def process_request(
 
     # update S3RequestTimestamp with the ingestion job start time
     try:
-        KNOWLEDGEBASE_TABLE.update_item(
+        DYNAMODB_CLIENT.update_item(
+            TableName=KNOWLEDGEBASE_TABLE_NAME,
             Key={
                 "KnowledgeBaseId": knowledgeBaseId,
                 "DataSourceId": dataSourceId,
@@ -123,33 +133,80 @@ class InputModel(BaseModel):
 
 
 @tracer.capture_method
-def record_handler(record: SQSRecord) -> None:
+def process_data_source_records(
+    records: list[tuple[SQSRecord, InputModel]],
+) -> list[str]:
     """
-    Process an SQS record..
+    Process the records of a batch that target the same data source.
+
+    An ingestion job syncs the whole data source, so only the newest document
+    record is processed, and it covers the older ones of the batch.
 
     Args:
-        record (SQSRecord): SQS message record containing the sync triggering request metadata
+        records (list[tuple[SQSRecord, InputModel]]): SQS records with their parsed payload
 
     Returns:
-        None
+        list[str]: Message IDs of the records that failed
     """
-    payload = parse(record.json_body, InputModel)
-    logger.info(payload)
-    process_request(
-        payload.knowledgeBaseId,
-        payload.dataSourceId,
-        payload.s3RequestTimestamp,
-        payload.key,
+    documents = [
+        (record, payload)
+        for record, payload in records
+        if not payload.key.endswith("/")
+    ]
+    if not documents:
+        return []
+
+    record, payload = max(
+        documents, key=lambda document: document[1].s3RequestTimestamp
     )
+    logger.info(payload, extra={"coalescedRecords": len(documents)})
+    try:
+        process_request(
+            payload.knowledgeBaseId,
+            payload.dataSourceId,
+            payload.s3RequestTimestamp,
+            payload.key,
+        )
+    except Exception:
+        logger.exception(f"Failed to process message {record.message_id}")
+        return [record.message_id]
+
+    return []
 
 
 @logger.inject_lambda_context
 @tracer.capture_lambda_handler
-def handler(event, context: LambdaContext) -> None:
-    """Lambda handler for processing SQS messages."""
-    return process_partial_response(
-        event=event,
-        record_handler=record_handler,
-        processor=processor,
-        context=context,
-    )
+def handler(event, context: LambdaContext) -> dict:
+    """Lambda handler for processing SQS messages.
+
+    Records are grouped by knowledge base data source, and the groups are processed
+    concurrently. Failed records are reported back as a partial batch response.
+    """
+    failed_message_ids = []
+    data_source_records = defaultdict(list)
+    for raw_record in event["Records"]:
+        record = SQSRecord(raw_record)
+        try:
+            payload = InputModel.model_validate_json(record.body)
+        except ValidationError:
+            logger.exception(f"Invalid message {record.message_id}")
+            failed_message_ids.append(record.message_id)
+            continue
+        data_source_records[(payload.knowledgeBaseId, payload.dataSourceId)].append(
+            (record, payload)
+        )
+
+    if data_source_records:
+        with ThreadPoolExecutor(
+            max_workers=min(SYNC_WORKERS, len(data_source_records))
+        ) as executor:
+            for failed in executor.map(
+                process_data_source_records, data_source_records.values()
+            ):
+                failed_message_ids.extend(failed)
+
+    return {
+        "batchItemFailures": [
+            {"itemIdentifier": message_id} for message_id in failed_message_ids
+        ]
+    }
@@ -7,6 +7,7 @@
 # ------------------------------------------------------------------------ #
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING, Mapping, Sequence, Union
 
 import boto3
@@ -15,6 +16,7 @@ from opensearchpy import (
     AWSV4SignerAuth,
     OpenSearch,
     OpenSearchException,
+    RequestError,
     RequestsHttpConnection,
 )
 
@@ -29,6 +31,34 @@ if TYPE_CHECKING:
     from aws_lambda_powertools import Logger
 
 
+@functools.lru_cache(maxsize=8)
+def _get_client(collection_id: str, aws_region: str) -> OpenSearch:
+    """Return an OpenSearch client for a collection, reused across warm invocations.
+
+    Args:
+        collection_id (str): OpenSearch Serverless collection ID
+        aws_region (str): AWS region of the collection
+
+    Returns:
+        OpenSearch: Client with its connection pool and SigV4 credentials
+    """
+    return OpenSearch(
+        hosts=[
+            {
+                "host": f"{collection_id}.{aws_region}.aoss.amazonaws.com",
+                "port": 443,
+            }
+        ],
+        http_auth=AWSV4SignerAuth(
+            boto3.Session().get_credentials(), aws_region, "aoss"
+        ),
+        use_ssl=True,
+        verify_certs=True,
+        connection_class=RequestsHttpConnection,
+        pool_maxsize=10,
+    )
+
+
 class IndexManager:
     __vector_field_name__ = "bedrock-knowledge-base-default-vector"
     __text_chunk_name__ = "AMAZON_BEDROCK_TEXT_CHUNK"
@@ -37,23 +67,8 @@ class IndexManager:
     def __init__(
         self, collection_id: str, aws_region: str, logger: Union[Logger, StdLogger]
     ):
-        os_endpoint = f"{collection_id}.{aws_region}.aoss.amazonaws.com"
         self._collection_id = collection_id
-        self._client = OpenSearch(
-            hosts=[
-                {
-                    "host": os_endpoint,
-                    "port": 443,
-                }
-            ],
-            http_auth=AWSV4SignerAuth(
-                boto3.Session().get_credentials(), aws_region, "aoss"
-            ),
-            use_ssl=True,
-            verify_certs=True,
-            connection_class=RequestsHttpConnection,
-            pool_maxsize=10,
-        )
+        self._client = _get_client(collection_id, aws_region)
         self._logger = logger
 
     def index_exists(self, index_name: str) -> bool:
@@ -82,12 +97,6 @@ class IndexManager:
         Returns:
             None
         """
-        if self.index_exists(index_name):
-            self._logger.info(
-                f"The index {index_name} exists already in collection {self._collection_id}"
-            )
-            return
-
         try:
             metadata_definition = [
                 MetadataManagementField(
@@ -102,14 +111,27 @@ class IndexManager:
             setting = self._create_setting()
             self._logger.info(setting)
 
-            self._client.indices.create(
+            # An existing index is reported by the create call itself, which saves
+            # a separate exists round trip
+            response = self._client.indices.create(
                 index_name,
                 body={
                     "settings": setting,
                     "mappings": mapping,
                 },
                 params={"wait_for_active_shards": "all"},
+                ignore=400,
             )
+            error = response.get("error")
+            if error:
+                error_type = error.get("type") if isinstance(error, dict) else error
+                if error_type == "resource_already_exists_exception":
+                    self._logger.info(
+                        f"The index {index_name} exists already in collection {self._collection_id}"
+                    )
+                    return
+                raise RequestError(400, error_type, response)
+
             self._logger.info(
                 f"Successfully started the creation of index {index_name}"
             )
@@ -5,10 +5,9 @@
 #
 # Helper functions for OpenSearch Serverless
 # ------------------------------------------------------------------------ #
+from dataclasses import dataclass
 from enum import Enum
 
-from pydantic import BaseModel, computed_field
-
 
 class Precision(Enum):
     BINARY = "binary"
@@ -20,21 +19,23 @@ class DistanceType(Enum):
     HAMMING = "hamming"
 
 
-class VectorDatabaseConfiguration(BaseModel):
+@dataclass(frozen=True, slots=True)
+class VectorDatabaseConfiguration:
     dimension: int
     precision: Precision
     distance_type: DistanceType
 
-    @computed_field
+    @property
     def precision_for_kb(self) -> str:
         return "BINARY" if self.precision == Precision.BINARY else "FLOAT32"
 
 
-class MetadataManagementField(BaseModel):
+@dataclass(frozen=True, slots=True)
+class MetadataManagementField:
     field: str
     data_type: str
     filterable: bool
 
-    @computed_field
+    @property
     def filterable_as_str(self) -> str:
         return "true" if self.filterable else "false"
@@ -22,9 +22,11 @@ def get_user_id(router: Router) -> Optional[str]:
     Returns:
         Optional[str]: The user ID (sub) from the identity if present, otherwise None
     """
-    user_id = router.current_event.get("identity", {}).get("sub")
-
-    return user_id
+    try:
+        return router.current_event["identity"]["sub"]
+    except (KeyError, TypeError):
+        # TypeError covers a null identity, e.g. for IAM-authorized requests
+        return None
 
 
 def fetch_user_id(router: Router) -> Callable:
@@ -43,7 +45,7 @@ def fetch_user_id(router: Router) -> Callable:
             user_id = get_user_id(router)
             if user_id is None:
                 raise UserNotFoundException()
-            return func(user_id=user_id, *args, **kwargs)
+            return func(*args, user_id=user_id, **kwargs)
 
         return wrapper
 
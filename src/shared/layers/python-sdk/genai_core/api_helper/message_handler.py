@@ -3,13 +3,28 @@
 # SPDX-License-Identifier: MIT-0
 # ------------------------------------------------------------------------ #
 
-import json
 import os
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 import boto3
+import orjson
 
 SNS_CLIENT = boto3.client("sns")
+MESSAGE_TOPIC_ARN = os.environ.get("MESSAGE_TOPIC_ARN")
+
+# SNS PublishBatch limits: entries per request and total payload size
+MAX_BATCH_ENTRIES = 10
+MAX_BATCH_BYTES = 256 * 1024
+
+
+def _encode(detail: Dict) -> str:
+    if not detail.get("direction"):
+        detail["direction"] = "OUT"
+
+    if not detail.get("framework"):
+        detail["framework"] = "BEDROCK_MANAGED"
+
+    return orjson.dumps(detail).decode()
 
 
 def send_to_client(detail: Dict, topic_arn: Optional[str] = None) -> None:
@@ -25,16 +40,55 @@ def send_to_client(detail: Dict, topic_arn: Optional[str] = None) -> None:
     Returns:
         None
     """
-    if not detail.get("direction"):
-        detail["direction"] = "OUT"
+    SNS_CLIENT.publish(
+        TopicArn=topic_arn or MESSAGE_TOPIC_ARN,
+        Message=_encode(detail),
+    )
 
-    if not detail.get("framework"):
-        detail["framework"] = "BEDROCK_MANAGED"
 
-    if not topic_arn:
-        topic_arn = os.environ["MESSAGE_TOPIC_ARN"]
+def send_batch_to_client(details: List[Dict], topic_arn: Optional[str] = None) -> None:
+    """
+    Send several messages to an SNS topic with as few PublishBatch calls as possible.
 
-    SNS_CLIENT.publish(
+    Messages are grouped within the PublishBatch entry and size limits. Entries the
+    batch call reports as failed are published again one by one.
+
+    Args:
+        details (List[Dict]): The messages to be sent, with the same defaults as send_to_client
+        topic_arn (Optional[str]): The ARN of the SNS topic to publish to. If not provided,
+                                  uses the MESSAGE_TOPIC_ARN environment variable.
+
+    Returns:
+        None
+    """
+    topic_arn = topic_arn or MESSAGE_TOPIC_ARN
+    batch: List[str] = []
+    batch_bytes = 0
+    for message in map(_encode, details):
+        message_bytes = len(message.encode())
+        if batch and (
+            len(batch) == MAX_BATCH_ENTRIES
+            or batch_bytes + message_bytes > MAX_BATCH_BYTES
+        ):
+            _publish_batch(batch, topic_arn)
+            batch, batch_bytes = [], 0
+        batch.append(message)
+        batch_bytes += message_bytes
+
+    if batch:
+        _publish_batch(batch, topic_arn)
+
+
+def _publish_batch(messages: List[str], topic_arn: Optional[str]) -> None:
+    if len(messages) == 1:
+        SNS_CLIENT.publish(TopicArn=topic_arn, Message=messages[0])
+        return
+
+    response = SNS_CLIENT.publish_batch(
         TopicArn=topic_arn,
-        Message=json.dumps(detail),
+        PublishBatchRequestEntries=[
+            {"Id": str(i), "Message": message} for i, message in enumerate(messages)
+        ],
     )
+    for failed in response.get("Failed", []):
+        SNS_CLIENT.publish(TopicArn=topic_arn, Message=messages[int(failed["Id"])])
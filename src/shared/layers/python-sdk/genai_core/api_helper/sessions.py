@@ -2,31 +2,59 @@
 #
 # SPDX-License-Identifier: MIT-0
 # ---------------------------------------------------------------------------- #
-import json
 import os
-from typing import Dict, List
+import random
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 import boto3
+import orjson
 from aws_lambda_powertools import Logger
 from botocore.exceptions import ClientError
+from genai_core.clients import CLIENT_CONFIG
 
 AWS_REGION = os.environ["AWS_REGION"]
 SESSIONS_TABLE_NAME = os.environ.get("SESSIONS_TABLE_NAME", "Table???")
 SESSIONS_BY_USER_ID_INDEX_NAME = os.environ.get("SESSIONS_BY_USER_ID_INDEX_NAME", "???")
 
-
-dynamodb = boto3.resource("dynamodb", region_name=AWS_REGION)
+# BatchWriteItem accepts up to 25 requests, batches are sent by a few workers
+BATCH_WRITE_SIZE = 25
+# BatchGetItem accepts up to 100 keys
+BATCH_GET_SIZE = 100
+DELETE_WORKERS = 4
+# Retries of unprocessed items and keys, with capped exponential backoff
+BATCH_ATTEMPTS = 5
+BACKOFF_BASE_S = 0.05
+BACKOFF_CAP_S = 2.0
+
+# Opt-in cache of session reads kept in the warm Lambda container. Sessions are
+# also written by other functions, so a cached entry may lag for up to the TTL.
+ENABLE_SESSION_MEMCACHE = os.environ.get("ENABLE_SESSION_MEMCACHE") == "1"
+SESSION_CACHE_TTL = 30
+SESSION_CACHE_SIZE = 512
+# (session ID, user ID) -> (lookup time, session record), least recently used first
+_SESSIONS: "OrderedDict[Tuple[str, str], Tuple[float, Dict]]" = OrderedDict()
+
+dynamodb = boto3.resource("dynamodb", region_name=AWS_REGION, config=CLIENT_CONFIG)
 table = dynamodb.Table(SESSIONS_TABLE_NAME)  # type: ignore
 logger = Logger()
 
 
-def get_session(session_id: str, user_id: str) -> Dict:
+def get_session(session_id: str, user_id: str, use_cache: bool = True) -> Dict:
     """
     Retrieves a session record from DynamoDB using the session ID and user ID.
 
+    When ENABLE_SESSION_MEMCACHE is set, records are served from an in-memory
+    cache for SESSION_CACHE_TTL seconds. The returned dict is a shallow copy: its
+    nested values, e.g. the History list, are shared with the cache and must be
+    treated as read-only.
+
     Args:
         session_id (str): The unique identifier for the session
         user_id (str): The unique identifier for the user
+        use_cache (bool): Whether a cached record may be returned
 
     Returns:
         Dict: The session record if found, empty dict if not found or error occurs
@@ -34,6 +62,14 @@ def get_session(session_id: str, user_id: str) -> Dict:
     Raises:
         ClientError: If there is an error communicating with DynamoDB
     """
+    key = (session_id, user_id)
+    now = time.monotonic()
+    if ENABLE_SESSION_MEMCACHE and use_cache:
+        cached = _SESSIONS.get(key)
+        if cached and now - cached[0] < SESSION_CACHE_TTL:
+            _SESSIONS.move_to_end(key)
+            return dict(cached[1])
+
     response = {}
     try:
         response = table.get_item(Key={"SessionId": session_id, "UserId": user_id})
@@ -42,16 +78,35 @@ def get_session(session_id: str, user_id: str) -> Dict:
             logger.warning("No record found with session id: %s", session_id)
         else:
             logger.exception(error)
+        return {}
+
+    item = response.get("Item", {})
+    if ENABLE_SESSION_MEMCACHE and item:
+        _SESSIONS[key] = (now, item)
+        _SESSIONS.move_to_end(key)
+        if len(_SESSIONS) > SESSION_CACHE_SIZE:
+            _SESSIONS.popitem(last=False)
+
+    return dict(item)
 
-    return response.get("Item", {})
 
+def _invalidate_session(session_id: str, user_id: str) -> None:
+    _SESSIONS.pop((session_id, user_id), None)
 
-def list_sessions_by_user_id(user_id: str) -> List:
+
+def list_sessions_by_user_id(
+    user_id: str,
+    projection: Optional[str] = None,
+    attribute_names: Optional[Dict[str, str]] = None,
+) -> List:
     """
     Retrieves all session records for a given user ID from DynamoDB using a secondary index.
 
     Args:
         user_id (str): The unique identifier for the user
+        projection (Optional[str]): ProjectionExpression limiting the attributes returned,
+            full records are returned if not provided
+        attribute_names (Optional[Dict[str, str]]): ExpressionAttributeNames used by the projection
 
     Returns:
         List: A list of session records associated with the user ID. Returns empty list if no records found or error occurs.
@@ -59,29 +114,25 @@ def list_sessions_by_user_id(user_id: str) -> List:
     Raises:
         ClientError: If there is an error communicating with DynamoDB
     """
+    query_args = {
+        "KeyConditionExpression": "UserId = :user_id",
+        "ExpressionAttributeValues": {":user_id": user_id},
+        "IndexName": SESSIONS_BY_USER_ID_INDEX_NAME,
+    }
+    if projection:
+        query_args["ProjectionExpression"] = projection
+    if attribute_names:
+        query_args["ExpressionAttributeNames"] = attribute_names
+
     items = []
     try:
-        last_evaluated_key = None
         while True:
-            if last_evaluated_key:
-                response = table.query(
-                    KeyConditionExpression="UserId = :user_id",
-                    ExpressionAttributeValues={":user_id": user_id},
-                    IndexName=SESSIONS_BY_USER_ID_INDEX_NAME,
-                    ExclusiveStartKey=last_evaluated_key,
-                )
-            else:
-                response = table.query(
-                    KeyConditionExpression="UserId = :user_id",
-                    ExpressionAttributeValues={":user_id": user_id},
-                    IndexName=SESSIONS_BY_USER_ID_INDEX_NAME,
-                )
-
+            response = table.query(**query_args)
             items.extend(response.get("Items", []))
 
-            last_evaluated_key = response.get("LastEvaluatedKey")
-            if not last_evaluated_key:
+            if "LastEvaluatedKey" not in response:
                 break
+            query_args["ExclusiveStartKey"] = response["LastEvaluatedKey"]
 
     except ClientError as error:
         if error.response["Error"]["Code"] == "ResourceNotFoundException":
@@ -92,6 +143,55 @@ def list_sessions_by_user_id(user_id: str) -> List:
     return items
 
 
+def batch_get_sessions(user_id: str, session_ids: List[str]) -> Dict[str, Dict]:
+    """
+    Retrieves several session records of a user with BatchGetItem.
+
+    Keys are sent in chunks of up to 100, and unprocessed keys are resent with
+    capped exponential backoff and jitter.
+
+    Args:
+        user_id (str): The unique identifier for the user
+        session_ids (List[str]): The session IDs to retrieve
+
+    Returns:
+        Dict[str, Dict]: The session records found, keyed by session ID
+
+    Raises:
+        ClientError: If there is an error communicating with DynamoDB
+    """
+    sessions = {}
+    unique_ids = list(dict.fromkeys(session_ids))
+    for i in range(0, len(unique_ids), BATCH_GET_SIZE):
+        request_items = {
+            SESSIONS_TABLE_NAME: {
+                "Keys": [
+                    {"SessionId": session_id, "UserId": user_id}
+                    for session_id in unique_ids[i : i + BATCH_GET_SIZE]
+                ]
+            }
+        }
+        for attempt in range(BATCH_ATTEMPTS):
+            if attempt:
+                time.sleep(
+                    random.uniform(0, min(BACKOFF_CAP_S, BACKOFF_BASE_S * 2**attempt))
+                )
+            response = table.meta.client.batch_get_item(RequestItems=request_items)
+            for item in response.get("Responses", {}).get(SESSIONS_TABLE_NAME, []):
+                sessions[item["SessionId"]] = item
+            request_items = response.get("UnprocessedKeys")
+            if not request_items:
+                break
+        else:
+            logger.warning(
+                "Sessions of user %s left unprocessed after %d attempts",
+                user_id,
+                BATCH_ATTEMPTS,
+            )
+
+    return sessions
+
+
 def delete_session(session_id: str, user_id: str) -> Dict:
     """
     Deletes a session record from DynamoDB using the session ID and user ID.
@@ -108,17 +208,23 @@ def delete_session(session_id: str, user_id: str) -> Dict:
     Raises:
         ClientError: If there is an error communicating with DynamoDB
     """
+    _invalidate_session(session_id, user_id)
+    deleted = True
     try:
-        table.delete_item(Key={"SessionId": session_id, "UserId": user_id})
+        # Called from delete_user_sessions' worker threads: the low-level client
+        # is thread-safe, the shared Table resource is not
+        table.meta.client.delete_item(
+            TableName=SESSIONS_TABLE_NAME,
+            Key={"SessionId": session_id, "UserId": user_id},
+        )
     except ClientError as error:
         if error.response["Error"]["Code"] == "ResourceNotFoundException":
             logger.warning("No record found with session id: %s", session_id)
         else:
             logger.exception(error)
+        deleted = False
 
-        return {"id": session_id, "deleted": False}
-
-    return {"id": session_id, "deleted": True}
+    return {"id": session_id, "deleted": deleted}
 
 
 def delete_user_sessions(user_id: str) -> List:
@@ -136,22 +242,61 @@ def delete_user_sessions(user_id: str) -> List:
     Raises:
         ClientError: If there is an error communicating with DynamoDB
     """
-    sessions = list_sessions_by_user_id(user_id)
-    ret_value = []
-
-    for session in sessions:
-        try:
-            result = delete_session(session["SessionId"], user_id)
-        except ClientError as error:
-            if error.response["Error"]["Code"] == "ResourceNotFoundException":
-                logger.warning(
-                    f"No record found with session id: {session} for user {user_id}"
+    session_ids = [
+        session["SessionId"]
+        for session in list_sessions_by_user_id(user_id, projection="SessionId")
+    ]
+    batches = [
+        session_ids[i : i + BATCH_WRITE_SIZE]
+        for i in range(0, len(session_ids), BATCH_WRITE_SIZE)
+    ]
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(DELETE_WORKERS, len(batches)))
+    ) as executor:
+        results = executor.map(lambda batch: _delete_sessions(batch, user_id), batches)
+        return [result for batch_results in results for result in batch_results]
+
+
+def _delete_sessions(session_ids: List[str], user_id: str) -> List[Dict]:
+    """
+    Deletes up to 25 sessions of a user with BatchWriteItem.
+
+    Unprocessed items are resent with capped exponential backoff and jitter. If
+    the batch call fails, or items remain unprocessed, the sessions are deleted one
+    by one, which is safe since deletes are idempotent.
+
+    Args:
+        session_ids (List[str]): The session IDs to delete
+        user_id (str): The unique identifier for the user
+
+    Returns:
+        List[Dict]: The {id, deleted} result of each session
+    """
+    request_items = {
+        SESSIONS_TABLE_NAME: [
+            {"DeleteRequest": {"Key": {"SessionId": session_id, "UserId": user_id}}}
+            for session_id in session_ids
+        ]
+    }
+    try:
+        for attempt in range(BATCH_ATTEMPTS):
+            if attempt:
+                time.sleep(
+                    random.uniform(0, min(BACKOFF_CAP_S, BACKOFF_BASE_S * 2**attempt))
                 )
-            else:
-                logger.exception(error)
-        ret_value.append({"id": session["SessionId"], "deleted": result["deleted"]})
+            response = table.meta.client.batch_write_item(RequestItems=request_items)
+            request_items = response.get("UnprocessedItems")
+            if not request_items:
+                for session_id in session_ids:
+                    _invalidate_session(session_id, user_id)
+                return [
+                    {"id": session_id, "deleted": True} for session_id in session_ids
+                ]
+    except ClientError as error:
+        logger.exception(error)
 
-    return ret_value
+    return [delete_session(session_id, user_id) for session_id in session_ids]
 
 
 def rename_session(user_id: str, session_id: str, title: str) -> bool:
@@ -163,21 +308,60 @@ def rename_session(user_id: str, session_id: str, title: str) -> bool:
         session_id: The identifier of the session to be renamed
 
     Returns:
-        bool: True if the session was successfully renamed, False otherwise
+        bool: True if the session was successfully renamed or already had the title,
+            False otherwise
     """
     try:
+        # The write is skipped when the title is unchanged
         table.update_item(
             Key={"SessionId": session_id, "UserId": user_id},
             UpdateExpression="SET #name = :new_name",
+            ConditionExpression="attribute_not_exists(#name) OR #name <> :new_name",
             ExpressionAttributeNames={"#name": "Title"},
             ExpressionAttributeValues={":new_name": title},
         )
+        _invalidate_session(session_id, user_id)
         return True
     except ClientError as error:
+        if error.response["Error"]["Code"] == "ConditionalCheckFailedException":
+            logger.info(f"Session {session_id} already has the requested title")
+            return True
         logger.exception(error)
         return False
 
 
+def _get_message_index(session_id: str, user_id: str, message_id: str) -> Optional[int]:
+    """
+    Finds the position of an assistant message in a session's History.
+
+    History is only ever appended to, so the position found in a cached session
+    stays valid. A message missing from a cached session may have been added
+    since, so the session is read again from DynamoDB before giving up.
+
+    Args:
+        session_id (str): The unique identifier for the session
+        user_id (str): The unique identifier for the user
+        message_id (str): The unique identifier for the message
+
+    Returns:
+        Optional[int]: The index of the message, None if it was not found
+    """
+    for use_cache in (True, False) if ENABLE_SESSION_MEMCACHE else (False,):
+        session = get_session(session_id, user_id, use_cache=use_cache)
+        history = session.get("History", [])
+        # Updates target the latest turns, so search from the end of History
+        for idx in range(len(history) - 1, -1, -1):
+            item = history[idx]
+            if item.get("messageId") == message_id and item.get("type") == "assistant":
+                return idx
+
+    if "History" not in session:
+        logger.warning(f"Session {session_id} not found for user {user_id}")
+    else:
+        logger.warning(f"Message {message_id} not found in session {session_id}")
+    return None
+
+
 def update_message_execution_time(
     user_id: str, session_id: str, message_id: str, execution_time_ms: int
 ) -> bool:
@@ -194,23 +378,8 @@ def update_message_execution_time(
         bool: True if the message was successfully updated, False otherwise
     """
     try:
-        # First, get the session to find the message index
-        session = get_session(session_id, user_id)
-        if not session or "History" not in session:
-            logger.warning(f"Session {session_id} not found for user {user_id}")
-            return False
-
-        # Find the index of the message in the History array
-        message_index = None
-        for idx, item in enumerate(session["History"]):
-            if item.get("type") != "assistant":
-                continue
-            if item.get("messageId") == message_id:
-                message_index = idx
-                break
-
+        message_index = _get_message_index(session_id, user_id, message_id)
         if message_index is None:
-            logger.warning(f"Message {message_id} not found in session {session_id}")
             return False
 
         # Update the specific message with execution time
@@ -220,6 +389,7 @@ def update_message_execution_time(
             ExpressionAttributeNames={"#data": "data"},
             ExpressionAttributeValues={":exec_time": execution_time_ms},
         )
+        _invalidate_session(session_id, user_id)
 
         logger.info(
             f"Updated execution time for message {message_id} in session {session_id}"
@@ -246,29 +416,18 @@ def save_tool_actions(
     Returns:
         bool: True if the tool actions were successfully saved, False otherwise
     """
+    # Parse tool actions JSON to store as list in DynamoDB, before any read
     try:
-        # First, get the session to find the message index
-        session = get_session(session_id, user_id)
-        if not session or "History" not in session:
-            logger.warning(f"Session {session_id} not found for user {user_id}")
-            return False
-
-        # Find the index of the message in the History array
-        message_index = None
-        for idx, item in enumerate(session["History"]):
-            if item.get("type") != "assistant":
-                continue
-            if item.get("messageId") == message_id:
-                message_index = idx
-                break
+        tool_actions_list = orjson.loads(tool_actions)
+    except orjson.JSONDecodeError as error:
+        logger.error(f"Invalid JSON for tool_actions: {error}")
+        return False
 
+    try:
+        message_index = _get_message_index(session_id, user_id, message_id)
         if message_index is None:
-            logger.warning(f"Message {message_id} not found in session {session_id}")
             return False
 
-        # Parse tool actions JSON to store as list in DynamoDB
-        tool_actions_list = json.loads(tool_actions)
-
         # Update the specific message with tool actions
         table.update_item(
             Key={"SessionId": session_id, "UserId": user_id},
@@ -276,6 +435,7 @@ def save_tool_actions(
             ExpressionAttributeNames={"#data": "data"},
             ExpressionAttributeValues={":tool_actions": tool_actions_list},
         )
+        _invalidate_session(session_id, user_id)
 
         logger.info(
             f"Saved tool actions for message {message_id} in session {session_id}"
@@ -285,6 +445,3 @@ def save_tool_actions(
     except ClientError as error:
         logger.exception(error)
         return False
-    except json.JSONDecodeError as error:
-        logger.error(f"Invalid JSON for tool_actions: {error}")
-        return False
@@ -0,0 +1,15 @@
+# ----------------------------------------------------------------------
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# SPDX-License-Identifier: MIT-0
+# ----------------------------------------------------------------------
+from botocore.config import Config
+
+# Shared by the Lambda functions that load this layer: kept-alive connections are
+# reused across warm invocations, adaptive retries absorb throttling
+CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    connect_timeout=3,
+    read_timeout=30,
+    retries={"max_attempts": 5, "mode": "adaptive"},
+)
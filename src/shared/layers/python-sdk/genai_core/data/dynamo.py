@@ -7,11 +7,16 @@
 
 from __future__ import annotations
 
+import functools
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional
 
 import boto3
 from botocore.exceptions import ClientError
+from genai_core.clients import CLIENT_CONFIG
 from genai_core.exceptions import ReadFromDynamoError, WriteToDynamoError
 from genai_core.types import ChatbotMessage, EChatbotMode, ERole
 
@@ -19,7 +24,26 @@ if TYPE_CHECKING:
     from aws_lambda_powertools import Logger
     from genai_core.processing.types import DocumentProcessingState
 
-DYNAMO_RESOURCE = boto3.resource("dynamodb")
+
+# Built on first use, so importing this module does not create a resource
+@functools.cache
+def _dynamo_resource():
+    return boto3.resource("dynamodb", config=CLIENT_CONFIG)
+
+
+# Short-lived cache of session items read by ChatHistoryHandler, shared by the
+# handlers of a warm container and bounded to keep memory flat
+SESSION_ITEM_TTL = 5
+SESSION_ITEM_CACHE_SIZE = 256
+# (session ID, user ID, projected attributes) -> (lookup time, session item),
+# least recently used first
+_SESSION_ITEMS: OrderedDict[tuple[str, str, tuple[str, ...]], tuple[float, dict]] = (
+    OrderedDict()
+)
+_SESSION_ITEMS_LOCK = threading.Lock()
+
+# Roles by value, to resolve the role of stored messages with a dict lookup
+_ROLES: dict[str, ERole] = {role.value: role for role in ERole}
 
 
 class DocumentStore:
@@ -42,7 +66,7 @@ class DocumentStore:
     """
 
     def __init__(self, table_name: str, logger: Logger):
-        self._table = DYNAMO_RESOURCE.Table(table_name)  # type: ignore
+        self._table = _dynamo_resource().Table(table_name)  # type: ignore
         self._logger = logger
 
     def update_field(self, document_id: str, field_name: str, field_value: str) -> None:
@@ -59,10 +83,34 @@ class DocumentStore:
         Raises:
             WriteToDynamoError: If DynamoDB operation fails
         """
+        self.update_fields(document_id, {field_name: field_value})
+
+    def update_fields(self, document_id: str, fields: Mapping[str, Any]) -> None:
+        """Updates several fields of a document record with a single write.
+
+        Args:
+            document_id (str): Unique identifier of the document to update
+            fields (Mapping[str, Any]): New values, keyed by field/attribute name
+
+        Returns:
+            None: Returns None but updates the specified fields in DynamoDB
+
+        Raises:
+            WriteToDynamoError: If DynamoDB operation fails
+        """
+        if not fields:
+            return
+
+        names = {f"#f{i}": name for i, name in enumerate(fields)}
+        values = {f":v{i}": value for i, value in enumerate(fields.values())}
         try:
             self._table.update_item(
                 Key={"DocumentId": document_id},
-                AttributeUpdates={field_name: {"Value": field_value, "Action": "PUT"}},
+                UpdateExpression="SET "
+                + ", ".join(f"{name} = {value}" for name, value in zip(names, values)),
+                ExpressionAttributeNames=names,
+                ExpressionAttributeValues=values,
+                ReturnValues="NONE",
             )
         except ClientError as err:
             raise WriteToDynamoError(self._table.table_name) from err
@@ -119,9 +167,10 @@ class ChatHistoryHandler:
     """
 
     def __init__(self, table_name: str, session_id: str, user_id: str, logger: Logger):
-        self._table = DYNAMO_RESOURCE.Table(table_name)  # type: ignore
+        self._table = _dynamo_resource().Table(table_name)  # type: ignore
         self._session_id = session_id
         self._user_id = user_id
+        self._key = (session_id, user_id)
         self._logger = logger
 
     def load_chat_history(self) -> Optional[List[ChatbotMessage]]:
@@ -135,7 +184,7 @@ class ChatHistoryHandler:
             Optional[List[ChatbotMessage]]: List of chat messages in chronological order,
                 or None if no history exists for the session.
         """
-        items = self._get_attributes()
+        items = self._get_attributes(projection=("History",))
         if items and "History" in items:
             return self._items_to_messages(items["History"])
 
@@ -143,7 +192,7 @@ class ChatHistoryHandler:
         return None
 
     def load_bedrock_session(self) -> Optional[str]:
-        items = self._get_attributes()
+        items = self._get_attributes(projection=("BedrockSessionId",))
         if items and "BedrockSessionId" in items:
             return items["BedrockSessionId"]
 
@@ -156,15 +205,18 @@ class ChatHistoryHandler:
         Returns:
             Dict: Combined dictionary of all references from AI messages
         """
-        items = self._get_attributes()
+        items = self._get_attributes(projection=("History",))
         if items is None:
             return None
 
         out = {}
 
-        for item in items:
+        for item in items.get("History", []):
+            # Most entries carry no references, so test them before the role
             refs = item.get("data", {}).get("references")
-            if refs and item.get("type") == "assistant":
+            if not refs:
+                continue
+            if item.get("type") == "assistant":
                 out.update(refs)
 
         return out
@@ -198,6 +250,117 @@ class ChatHistoryHandler:
         Returns:
             None
         """
+        to_add = [
+            self._history_entry(
+                message,
+                render,
+                references=references,
+                inferenceConfig=inferenceConfig,
+                reasoning_content=reasoning_content,
+                structured_output=structured_output,
+            )
+        ]
+        self._append_to_history(
+            to_add,
+            bedrock_session_id=bedrock_session_id,
+            configuration_name=configuration_name,
+            inference_config_as_str=inference_config_as_str,
+            configuration_agent_mode=configuration_agent_mode,
+            runtime_id=runtime_id,
+            runtime_version=runtime_version,
+            endpoint_name=endpoint_name,
+        )
+
+    def add_messages_to_chat(
+        self,
+        messages: List[ChatbotMessage],
+        render: bool,
+        runtime_id: Optional[str] = None,
+        runtime_version: Optional[str] = None,
+        endpoint_name: Optional[str] = None,
+    ) -> None:
+        """Adds several messages to the chat history in one write.
+
+        Meant for replaying or backfilling conversations: all messages are appended
+        with a single update instead of one call per turn.
+
+        Args:
+            messages (List[ChatbotMessage]): The messages to add, in chronological order
+            render (bool): Whether the messages should be rendered in the UI
+            runtime_id (Optional[str], optional): Agent runtime stored on new sessions. Defaults to None.
+            runtime_version (Optional[str], optional): Runtime version stored on new sessions. Defaults to None.
+            endpoint_name (Optional[str], optional): Endpoint stored on new sessions. Defaults to None.
+
+        Returns:
+            None
+        """
+        if not messages:
+            return
+
+        self._append_to_history(
+            [self._history_entry(message, render) for message in messages],
+            runtime_id=runtime_id,
+            runtime_version=runtime_version,
+            endpoint_name=endpoint_name,
+        )
+
+    def add_exchange_to_chat(
+        self,
+        user_message: ChatbotMessage,
+        assistant_message: ChatbotMessage,
+        render: bool,
+        references: Optional[List[Dict]] = None,
+        reasoning_content: Optional[str] = None,
+        structured_output: Optional[str] = None,
+        runtime_id: Optional[str] = None,
+        runtime_version: Optional[str] = None,
+        endpoint_name: Optional[str] = None,
+    ) -> None:
+        """Adds a user prompt and the assistant response to the chat history in one write.
+
+        Both messages are appended to the session item with a single update, so the
+        exchange is stored atomically.
+
+        Args:
+            user_message (ChatbotMessage): The user prompt
+            assistant_message (ChatbotMessage): The assistant response
+            render (bool): Whether the messages should be rendered in the UI
+            references (Optional[List[Dict]], optional): References of the response. Defaults to None.
+            reasoning_content (Optional[str], optional): Reasoning of the response. Defaults to None.
+            structured_output (Optional[str], optional): Structured output of the response. Defaults to None.
+            runtime_id (Optional[str], optional): Agent runtime stored on new sessions. Defaults to None.
+            runtime_version (Optional[str], optional): Runtime version stored on new sessions. Defaults to None.
+            endpoint_name (Optional[str], optional): Endpoint stored on new sessions. Defaults to None.
+
+        Returns:
+            None
+        """
+        to_add = [
+            self._history_entry(user_message, render),
+            self._history_entry(
+                assistant_message,
+                render,
+                references=references,
+                reasoning_content=reasoning_content,
+                structured_output=structured_output,
+            ),
+        ]
+        self._append_to_history(
+            to_add,
+            runtime_id=runtime_id,
+            runtime_version=runtime_version,
+            endpoint_name=endpoint_name,
+        )
+
+    def _history_entry(
+        self,
+        message: ChatbotMessage,
+        render: bool,
+        references: Optional[List[Dict]] = None,
+        inferenceConfig: Optional[Dict] = None,
+        reasoning_content: Optional[str] = None,
+        structured_output: Optional[str] = None,
+    ) -> dict[str, Any]:
         message_data: dict[str, Any] = {"content": message.get_message()}
         if references:
             self._logger.debug(references)
@@ -212,56 +375,97 @@ class ChatHistoryHandler:
         if structured_output:
             message_data["structuredOutput"] = structured_output
 
-        to_add = [
-            {
-                "data": message_data,
-                "messageId": message.messageId,
-                "type": message.role.value,
-                "render": render,
-            }
+        return {
+            "data": message_data,
+            "messageId": message.messageId,
+            "type": message.role.value,
+            "render": render,
+        }
+
+    def _append_to_history(
+        self,
+        to_add: List[Dict],
+        bedrock_session_id: Optional[str] = None,
+        configuration_name: Optional[str] = None,
+        inference_config_as_str: Optional[str] = None,
+        configuration_agent_mode: Optional[EChatbotMode] = None,
+        runtime_id: Optional[str] = None,
+        runtime_version: Optional[str] = None,
+        endpoint_name: Optional[str] = None,
+    ) -> None:
+        with _SESSION_ITEMS_LOCK:
+            for key in [k for k in _SESSION_ITEMS if k[:2] == self._key]:
+                del _SESSION_ITEMS[key]
+        # Attributes describing the session are only set when the item is created
+        session_attributes = {
+            "StartTime": datetime.now(timezone.utc).isoformat(),
+            "BedrockSessionId": bedrock_session_id,
+            "ConfigurationName": configuration_name,
+            "ConfigurationValue": inference_config_as_str,
+            "ExecutionMode": (
+                configuration_agent_mode.value if configuration_agent_mode else None
+            ),
+            "RuntimeId": runtime_id,
+            "RuntimeVersion": runtime_version,
+            "Endpoint": endpoint_name,
+        }
+        updates = [
+            "History = list_append(if_not_exists(History, :empty), :new_message)"
         ]
+        names: dict[str, str] = {}
+        values: dict[str, Any] = {":empty": [], ":new_message": to_add}
+        for i, (attribute, value) in enumerate(session_attributes.items()):
+            if value:
+                updates.append(f"#a{i} = if_not_exists(#a{i}, :a{i})")
+                names[f"#a{i}"] = attribute
+                values[f":a{i}"] = value
 
         try:
             self._table.update_item(
                 Key={"SessionId": self._session_id, "UserId": self._user_id},
-                UpdateExpression="SET History = list_append(History, :new_message)",
-                ExpressionAttributeValues={":new_message": to_add},
-            )
-            self._logger.info(
-                f"Message added to history to session {self._session_id} - user {self._user_id}"
-            )
-        except ClientError:
-            new_item_attributes = {
-                "SessionId": self._session_id,
-                "UserId": self._user_id,
-                "History": to_add,
-                "StartTime": datetime.now(timezone.utc).isoformat(),
-            }
-            if bedrock_session_id:
-                new_item_attributes["BedrockSessionId"] = bedrock_session_id
-            if configuration_name:
-                new_item_attributes["ConfigurationName"] = configuration_name
-            if inference_config_as_str:
-                new_item_attributes["ConfigurationValue"] = inference_config_as_str
-            if configuration_agent_mode:
-                new_item_attributes["ExecutionMode"] = configuration_agent_mode.value
-            if runtime_id:
-                new_item_attributes["RuntimeId"] = runtime_id
-            if runtime_version:
-                new_item_attributes["RuntimeVersion"] = runtime_version
-            if endpoint_name:
-                new_item_attributes["Endpoint"] = endpoint_name
-            self._table.put_item(Item=new_item_attributes)
-            self._logger.info(
-                f"New chat history created for session {self._session_id} - user {self._user_id}"
+                UpdateExpression="SET " + ", ".join(updates),
+                ExpressionAttributeNames=names,
+                ExpressionAttributeValues=values,
             )
+        except ClientError as err:
+            raise WriteToDynamoError(self._table.table_name) from err
+
+        self._logger.info(
+            f"{len(to_add)} message(s) added to history of session {self._session_id} - user {self._user_id}"
+        )
+
+    def _get_attributes(
+        self, projection: tuple[str, ...] = (), force_refresh: bool = False
+    ) -> Optional[dict]:
+        """Reads the session item, restricted to the projected attributes if any.
+
+        Items are cached per container for SESSION_ITEM_TTL seconds. Only writes
+        made through ChatHistoryHandler evict them. Writes from other functions,
+        such as update_message_execution_time in the HTTP API handler, do not, so
+        a cached item can be up to SESSION_ITEM_TTL seconds stale. The returned
+        dict is a shallow copy. Its nested values, e.g. the History list, are
+        shared with the cache and must be treated as read-only.
+        """
+        key = (*self._key, projection)
+        now = time.monotonic()
+        if not force_refresh:
+            with _SESSION_ITEMS_LOCK:
+                cached = _SESSION_ITEMS.get(key)
+                if cached and now - cached[0] < SESSION_ITEM_TTL:
+                    _SESSION_ITEMS.move_to_end(key)
+                    return dict(cached[1])
+
+        get_args: dict[str, Any] = {
+            "Key": {"SessionId": self._session_id, "UserId": self._user_id}
+        }
+        if projection:
+            names = {f"#p{i}": attribute for i, attribute in enumerate(projection)}
+            get_args["ProjectionExpression"] = ", ".join(names)
+            get_args["ExpressionAttributeNames"] = names
 
-    def _get_attributes(self) -> Optional[dict]:
         response = None
         try:
-            response = self._table.get_item(
-                Key={"SessionId": self._session_id, "UserId": self._user_id}
-            )
+            response = self._table.get_item(**get_args)
         except ClientError as error:
             if error.response["Error"]["Code"] == "ResourceNotFoundException":
                 self._logger.warning(
@@ -270,39 +474,36 @@ class ChatHistoryHandler:
             else:
                 self._logger.exception(error)
 
-        return response["Item"] if response and "Item" in response else None
+        item = response["Item"] if response and "Item" in response else None
+        if item is not None:
+            with _SESSION_ITEMS_LOCK:
+                _SESSION_ITEMS[key] = (now, item)
+                _SESSION_ITEMS.move_to_end(key)
+                if len(_SESSION_ITEMS) > SESSION_ITEM_CACHE_SIZE:
+                    _SESSION_ITEMS.popitem(last=False)
+            return dict(item)
+
+        return None
 
     @staticmethod
     def _items_to_messages(items: List) -> List[ChatbotMessage]:
+        # History entries were validated before they were written, so long
+        # histories are loaded without running the validator for every entry
         return [
-            ChatbotMessage.init_from_string(
+            ChatbotMessage.model_construct(
                 messageId=item.get("data", {}).get("messageId", f"msg-{i}-orphan"),
-                message=item.get("data", {}).get("content", "???"),
-                role=ERole(item.get("type", "assistant")),
+                role=_ROLES[item.get("type", "assistant")],
+                content=[{"text": item.get("data", {}).get("content", "???")}],
             )
             for i, item in enumerate(items)
         ]
 
     @classmethod
-    def _convert_floats_to_strings(cls, data):
-        def _format_special_fields(key, value):
-            if isinstance(value, float):
-                if key == "temperature":
-                    return f"{value:.2f}"
-            return cls._convert_floats_to_strings(value)
-
+    def _convert_floats_to_strings(cls, data, key: Optional[str] = None):
+        if isinstance(data, float):
+            return f"{data:.2f}" if key == "temperature" else str(data)
         if isinstance(data, dict):
-            return {
-                key: (
-                    _format_special_fields(key, value)
-                    if key in ["temperature"]
-                    else cls._convert_floats_to_strings(value)
-                )
-                for key, value in data.items()
-            }
-        elif isinstance(data, list):
+            return {k: cls._convert_floats_to_strings(v, k) for k, v in data.items()}
+        if isinstance(data, list):
             return [cls._convert_floats_to_strings(item) for item in data]
-        elif isinstance(data, float):
-            return str(data)
-        else:
-            return data
+        return data
@@ -4,20 +4,26 @@
 # ----------------------------------------------------------------------
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
+from functools import cache, lru_cache
 from typing import TYPE_CHECKING, Mapping
 
 import boto3
+import orjson
 from botocore.exceptions import ClientError
+from genai_core.clients import CLIENT_CONFIG
 
 if TYPE_CHECKING:
     from botocore.client import BaseClient
 
-DEFAULT_CLIENT = boto3.client("s3")
 
+# Built on first use, callers usually pass their own client
+@cache
+def _default_client() -> BaseClient:
+    return boto3.client("s3", config=CLIENT_CONFIG)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class S3Object:
     """Pythonic representation of an S3 Object.
 
@@ -50,7 +56,7 @@ def load_json(s3_uri: str, s3_client: BaseClient, return_as_str: bool = False) -
         ClientError: If there is an error accessing the S3 bucket.
     """
     s3_obj = _process_uri(s3_uri)
-    s3_client = s3_client if s3_client else DEFAULT_CLIENT  # type: ignore
+    s3_client = s3_client if s3_client else _default_client()
 
     if s3_obj.obj_type != "json":
         raise ValueError(
@@ -58,9 +64,9 @@ def load_json(s3_uri: str, s3_client: BaseClient, return_as_str: bool = False) -
         )
 
     response = _safe_get_object(s3_obj, s3_client)
-    json_data = json.loads(response["Body"].read().decode("utf-8"))
+    json_data = orjson.loads(response["Body"].read())
 
-    return json.dumps(json_data) if return_as_str else json_data
+    return orjson.dumps(json_data).decode() if return_as_str else json_data
 
 
 def upload_json(
@@ -75,7 +81,7 @@ def upload_json(
         obj_key (str): The key (file path) for the uploaded object in the S3 bucket.
     """
     s3_client.put_object(
-        Body=json.dumps(data).encode("UTF-8"),
+        Body=orjson.dumps(data),
         Bucket=destination_bucket,
         Key=obj_key,
         ContentType="application/json",
@@ -83,13 +89,12 @@ def upload_json(
 
 
 # ****************************************** Private API ***************************************** #
+@lru_cache(maxsize=1024)
 def _process_uri(s3_uri: str) -> S3Object:
-    """Generates an S3Object from an S3 URI"""
-    parts = s3_uri.split("/")
-    bucket, obj_key = parts[2], "/".join(parts[3:])
-
-    parts = obj_key.split(".")
-    obj_type = "folder" if len(parts) == 1 else obj_key.split(".")[-1].lower()
+    """Generates an S3Object from an S3 URI, cached since S3Object is immutable"""
+    bucket, _, obj_key = s3_uri.partition("://")[2].partition("/")
+    _, dot, extension = obj_key.rpartition(".")
+    obj_type = extension.lower() if dot else "folder"
     return S3Object(bucket_name=bucket, obj_key=obj_key, obj_type=obj_type)
 
 
@@ -11,10 +11,16 @@ class AcaException(Exception):
 
     Attributes:
         __error_code__ (int): error code associated with the exception
+        __error_code_str__ (str): formatted error code, set once per class
     """
 
     __error_code__ = 0
     __app__ = "ACA"
+    __error_code_str__ = "ACA-000"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.__error_code_str__ = f"{cls.__app__}-{cls.__error_code__:03d}"
 
     @classmethod
     def get_error_number(cls) -> int:
@@ -28,7 +34,7 @@ class AcaException(Exception):
     @classmethod
     def get_error_code(cls) -> str:
         """Get the string representation of the error code"""
-        return f"{cls.__app__}-{str(cls.__error_code__).zfill(3)}"
+        return cls.__error_code_str__
 
     def __str__(self) -> str:
         """Format error message."""
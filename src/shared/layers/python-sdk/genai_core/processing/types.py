@@ -7,20 +7,25 @@
 from enum import Enum
 
 # ------------------------- Constants ------------------------ #
-VIDEO_EXTENSIONS = (
-    ".mp3",
-    ".mp4",
-    ".wav",
-    ".flac",
-    ".ogg",
-    ".amr",
-    ".webm",
+# Lower-case extensions, as sets for constant-time membership checks
+VIDEO_EXTENSIONS = frozenset(
+    {
+        ".mp3",
+        ".mp4",
+        ".wav",
+        ".flac",
+        ".ogg",
+        ".amr",
+        ".webm",
+    }
 )
-BEDROCK_KB_SUPPORTED_OFFICE_EXTENSIONS = (
-    ".doc",
-    ".docx",
-    ".xls",
-    ".xlsx",
+BEDROCK_KB_SUPPORTED_OFFICE_EXTENSIONS = frozenset(
+    {
+        ".doc",
+        ".docx",
+        ".xls",
+        ".xlsx",
+    }
 )
 # PRESENTATION_EXTENSIONS = (
 #     ".ppt",
@@ -16,7 +16,8 @@ def generate_doc_hash(document_key: str, prefix_level: int = 0) -> str:
         str: A 32-character hash string formatted as 4 groups of 8 characters separated by hyphens
 
     """
-    hash_val = blake2b(digest_size=16)
-    hash_val.update("/".join(document_key.split("/")[prefix_level:]).encode("UTF-8"))
-    h_as_str = hash_val.hexdigest()
-    return f"{h_as_str[0:8]}-{h_as_str[8:16]}-{h_as_str[16:24]}-{h_as_str[24:32]}"
+    if prefix_level:
+        document_key = "/".join(document_key.split("/")[prefix_level:])
+    digest = blake2b(document_key.encode("UTF-8"), digest_size=16).digest()
+    # 4 bytes per group, i.e. 8 hex characters
+    return digest.hex("-", 4)